@@ -20,6 +20,8 @@ Usage:
 import os
 import sys
 import re
+from collections import defaultdict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Tuple, Set
 
@@ -36,23 +38,34 @@ EXCLUDE_FILES = {
     'pages/_document.tsx',
 }
 
+# Success criteria that fail validation; everything else is a Level AAA recommendation
+LEVEL_A_CRITERIA = frozenset({'2.5.1', '2.5.2', '2.5.3', '2.5.4'})
+
+# Down-event handlers that trigger significant actions (SC 2.5.2); group 1 is the event name
+DOWN_EVENT_PATTERN = re.compile(
+    r'(onMouseDown|onPointerDown|onTouchStart)\s*=\s*{[^}]*(?:submit|delete|send|post|update|save|create)[^}]*}',
+    re.IGNORECASE,
+)
+
+# Canonical spelling of each DOWN_EVENT_PATTERN event name, keyed by its lowercase form
+DOWN_EVENT_NAMES = {name.lower(): name for name in ('onMouseDown', 'onPointerDown', 'onTouchStart')}
+
+@dataclass(frozen=True, slots=True)
 class InputModalityIssue:
-    """Represents an input modality accessibility issue"""
-    def __init__(self, file_path: str, line_num: int, issue_type: str, message: str, sc: str):
-        """Initialize an input modality accessibility issue.
-        
-        Args:
-            file_path: Path to the file containing the issue
-            line_num: Line number where issue occurs
-            issue_type: Type of input modality issue
-            message: Description of the issue
-            sc: WCAG Success Criterion reference
-        """
-        self.file_path = file_path
-        self.line_num = line_num
-        self.issue_type = issue_type
-        self.message = message
-        self.sc = sc  # Success Criterion
+    """Represents an input modality accessibility issue
+    
+    Attributes:
+        file_path: Path to the file containing the issue
+        line_num: Line number where issue occurs
+        issue_type: Type of input modality issue
+        message: Description of the issue
+        sc: WCAG Success Criterion reference
+    """
+    file_path: str
+    line_num: int
+    issue_type: str
+    message: str
+    sc: str
 
 def scan_files(root_dir: Path) -> List[Path]:
     """Scan for TypeScript/TSX files to validate"""
@@ -162,37 +175,33 @@ def check_pointer_cancellation(file_path: Path, lines: List[str]) -> List[InputM
     
     # Check for down-event handlers that might trigger actions
     for i, line in enumerate(lines, 1):
-        down_event_patterns = [
-            (r'onMouseDown\s*=\s*{[^}]*(?:submit|delete|send|post|update|save|create)[^}]*}', 'onMouseDown'),
-            (r'onPointerDown\s*=\s*{[^}]*(?:submit|delete|send|post|update|save|create)[^}]*}', 'onPointerDown'),
-            (r'onTouchStart\s*=\s*{[^}]*(?:submit|delete|send|post|update|save|create)[^}]*}', 'onTouchStart'),
-        ]
-        
-        for pattern, event_name in down_event_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                # Get more context to see if this is actually triggering an action
-                context_start = max(0, i - 3)
-                context_end = min(len(lines), i + 3)
-                context = ''.join(lines[context_start:context_end])
-                
-                # Check if it's part of a harmless interaction (focus, highlight, etc.)
-                safe_patterns = [
-                    r'setFocus',
-                    r'setActive',
-                    r'setHover',
-                    r'highlight',
-                ]
-                
-                is_safe = any(re.search(safe_pattern, context, re.IGNORECASE) for safe_pattern in safe_patterns)
-                
-                if not is_safe:
-                    issues.append(InputModalityIssue(
-                        file_path=str(file_path),
-                        line_num=i,
-                        issue_type='pointer_cancellation',
-                        message=f'{event_name} appears to trigger significant action. Use onClick (up-event) instead',
-                        sc='2.5.2'
-                    ))
+        down_event_match = DOWN_EVENT_PATTERN.search(line)
+        if down_event_match:
+            # IGNORECASE matches any casing; report the canonical handler name
+            event_name = DOWN_EVENT_NAMES[down_event_match.group(1).lower()]
+            # Get more context to see if this is actually triggering an action
+            context_start = max(0, i - 3)
+            context_end = min(len(lines), i + 3)
+            context = ''.join(lines[context_start:context_end])
+            
+            # Check if it's part of a harmless interaction (focus, highlight, etc.)
+            safe_patterns = [
+                r'setFocus',
+                r'setActive',
+                r'setHover',
+                r'highlight',
+            ]
+            
+            is_safe = any(re.search(safe_pattern, context, re.IGNORECASE) for safe_pattern in safe_patterns)
+            
+            if not is_safe:
+                issues.append(InputModalityIssue(
+                    file_path=str(file_path),
+                    line_num=i,
+                    issue_type='pointer_cancellation',
+                    message=f'{event_name} appears to trigger significant action. Use onClick (up-event) instead',
+                    sc='2.5.2'
+                ))
     
     return issues
 
@@ -210,9 +219,13 @@ def check_label_in_name(file_path: Path, lines: List[str]) -> List[InputModality
     - Voice input users speak visible labels to activate controls
     - Mismatch between visible label and accessible name causes failures
     """
-    issues = []
     content = ''.join(lines)
-    
+    # Both checks below require an aria-label, so skip the regex work entirely without one
+    if 'aria-label' not in content:
+        return []
+
+    issues = []
+
     # Check buttons with both visible text and aria-label
     button_pattern = r'<[Bb]utton[^>]*aria-label\s*=\s*["\']([^"\']+)["\'][^>]*>(.*?)</[Bb]utton>'
     buttons = re.finditer(button_pattern, content, re.DOTALL)
@@ -425,24 +438,39 @@ def validate_file(file_path: Path) -> List[InputModalityIssue]:
         return []
     
     issues = []
-    
-    # Run all checks
-    issues.extend(check_pointer_gestures(file_path, lines))
-    issues.extend(check_pointer_cancellation(file_path, lines))
-    issues.extend(check_label_in_name(file_path, lines))
-    issues.extend(check_motion_actuation(file_path, lines))
-    issues.extend(check_target_size(file_path, lines))
-    issues.extend(check_concurrent_input(file_path, lines))
+    seen: Set[Tuple[int, str]] = set()
+    
+    # Run all checks, reporting each success criterion at most once per line
+    for check in (
+        check_pointer_gestures,
+        check_pointer_cancellation,
+        check_label_in_name,
+        check_motion_actuation,
+        check_target_size,
+        check_concurrent_input,
+    ):
+        for issue in check(file_path, lines):
+            key = (issue.line_num, issue.sc)
+            if key in seen:
+                continue
+            seen.add(key)
+            issues.append(issue)
     
     return issues
 
 def print_violations(issues: List[InputModalityIssue], total_files: int) -> None:
     """Print validation results"""
-    # Separate Level A errors from Level AAA warnings
-    level_a_issues = [i for i in issues if i.sc in ['2.5.1', '2.5.2', '2.5.3', '2.5.4']]
-    level_aaa_issues = [i for i in issues if i.sc in ['2.5.5', '2.5.6']]
+    # Separate Level A errors (grouped by success criterion) from Level AAA warnings
+    issues_by_sc: Dict[str, List[InputModalityIssue]] = defaultdict(list)
+    level_aaa_issues: List[InputModalityIssue] = []
+    for issue in issues:
+        if issue.sc in LEVEL_A_CRITERIA:
+            issues_by_sc[issue.sc].append(issue)
+        else:
+            level_aaa_issues.append(issue)
+    level_a_count = sum(len(sc_issues) for sc_issues in issues_by_sc.values())
     
-    if not level_a_issues and not level_aaa_issues:
+    if not level_a_count and not level_aaa_issues:
         print(f"✅ Input Modalities validation complete: {total_files} files scanned, 0 issues found")
         print("\nWCAG 2.1 Guideline 2.5 (Input Modalities) - All Success Criteria: PASS")
         print("- SC 2.5.1 Pointer Gestures (Level A): ✓")
@@ -455,17 +483,10 @@ def print_violations(issues: List[InputModalityIssue], total_files: int) -> None
         return
     
     # Print errors and warnings separately
-    if level_a_issues:
-        print(f"❌ Input Modalities validation failed: {len(level_a_issues)} Level A issues found")
+    if level_a_count:
+        print(f"❌ Input Modalities validation failed: {level_a_count} Level A issues found")
         print()
         
-        # Group by success criterion
-        issues_by_sc: Dict[str, List[InputModalityIssue]] = {}
-        for issue in level_a_issues:
-            if issue.sc not in issues_by_sc:
-                issues_by_sc[issue.sc] = []
-            issues_by_sc[issue.sc].append(issue)
-        
         sc_names = {
             '2.5.1': 'Pointer Gestures (Level A)',
             '2.5.2': 'Pointer Cancellation (Level A)',
@@ -516,8 +537,7 @@ def main() -> int:
     print_violations(all_issues, len(files))
     
     # Only fail on Level A issues
-    level_a_issues = [i for i in all_issues if i.sc in ['2.5.1', '2.5.2', '2.5.3', '2.5.4']]
-    return 1 if level_a_issues else 0
+    return 1 if any(i.sc in LEVEL_A_CRITERIA for i in all_issues) else 0
 
 if __name__ == '__main__':
     sys.exit(main())
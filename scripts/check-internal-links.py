@@ -2,19 +2,179 @@
 """
 Internal Links Validation Script
 
-Validates internal linking structure:
-- No broken internal links
-- No redirect chains
-- All links use absolute paths or proper relative paths
-- Link anchor text is descriptive
+Validates internal linking structure of the built site (.next/server/pages):
+- Every internal <a href> resolves to a built page or a static file in public/
+- External, mailto:, tel: and anchor-only links are ignored
+
+Usage:
+    python3 scripts/check-internal-links.py  (after `yarn build`)
 """
 
+import hashlib
+import html
+import mmap
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from bs4 import BeautifulSoup
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from urllib.parse import urlparse
 
 
+# Pages at least this large are memory-mapped rather than copied into a bytes object
+MMAP_THRESHOLD = 1024 * 1024
+
+# Characters that urlparse() treats specially inside a path (params, stripped whitespace)
+ROOT_PATH_SLOW_CHARS = ";\t\r\n"
+
+# Pages with byte-identical HTML reuse their extracted hrefs, keyed by content digest (per worker, LRU)
+HREF_CACHE_SIZE = 4096
+_hrefs_by_digest: Dict[bytes, List[str]] = {}
+
+# One streaming pass over the page: comments and inline script/style blocks (including __NEXT_DATA__)
+# are matched as group 1 and skipped; otherwise group 2 spans the attributes of an <a> tag. As in
+# html.parser, a quote only opens a value right after "=", so a ">" inside a quoted value (e.g.
+# title="a>b") does not end the tag, a self-closed <script/> or <style/> has no content to skip and an
+# unclosed one runs to the end of the page
+ANCHOR_RE = re.compile(
+    rb'''<!--.*?-->'''
+    rb'''|<(script|style)\b(?>[^>=]+|=+\s*(?:"[^"]*"|'[^']*')?)*(?<!/)>.*?(?:</\1\s*>|\Z)'''
+    rb'''|<a(?=[\s/])((?>[^>=]+|=+\s*(?:"[^"]*"|'[^']*')?)*)>''',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# One attribute of a tag and its optional value, as html.parser tokenizes them
+ATTRIBUTE_RE = re.compile(
+    rb'''((?<=['"\s/])[^\s/>][^\s/=>]*)(?:\s*=+\s*('[^']*'|"[^"]*"|(?!['"])[^>\s]*))?(?:\s|/(?!>))*'''
+)
+
+
+def extract_hrefs(content: bytes) -> List[str]:
+    """Return the decoded href of every rendered <a> tag in an HTML document.
+
+    Like BeautifulSoup with html.parser, a valueless href counts as empty and the last of
+    duplicate hrefs wins.
+    """
+    hrefs = []
+    for match in ANCHOR_RE.finditer(content):
+        # Comments and script/style blocks match without an <a> tag
+        if match.start(2) < 0:
+            continue
+        raw = None
+        for attribute in ATTRIBUTE_RE.finditer(content, match.start(2), match.end(2)):
+            if attribute.group(1).lower() == b"href":
+                raw = attribute.group(2) or b""
+        if raw is None:
+            continue
+        if raw[:1] in (b"'", b'"'):
+            raw = raw[1:-1]
+        hrefs.append(html.unescape(raw.decode("utf-8", "replace")))
+    return hrefs
+
+
+def extract_hrefs_cached(content: bytes) -> List[str]:
+    """Like extract_hrefs(), but skips the scan for content already seen by this process."""
+    digest = hashlib.blake2b(content, digest_size=16).digest()
+    hrefs = _hrefs_by_digest.pop(digest, None)
+    if hrefs is None:
+        hrefs = extract_hrefs(content)
+        if len(_hrefs_by_digest) >= HREF_CACHE_SIZE:
+            # Evict the least recently used entry (dicts keep insertion order)
+            del _hrefs_by_digest[next(iter(_hrefs_by_digest))]
+    _hrefs_by_digest[digest] = hrefs
+    return hrefs
+
+
+def read_hrefs(file_path: Path) -> List[str]:
+    """Return every <a> href in an HTML file, scanning the raw bytes without decoding the page."""
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return extract_hrefs_cached(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return extract_hrefs_cached(mapped)
+
+
+def prewarm_file(path) -> None:
+    """Ask the kernel to start reading a file into the page cache ahead of the scan."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        else:
+            # No fadvise (e.g. macOS): touching the first block still pulls it into the cache
+            os.read(fd, 65536)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def prewarm_files(paths) -> None:
+    """Warm the page cache for all paths before any worker process is forked.
+
+    POSIX_FADV_WILLNEED only queues asynchronous readahead, so it is issued from the calling
+    thread and returns at once; the read fallback runs in a thread pool that is shut down
+    before returning, so no thread is left running when ProcessPoolExecutor forks.
+    """
+    if hasattr(os, "posix_fadvise"):
+        for path in paths:
+            prewarm_file(path)
+        return
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        executor.map(prewarm_file, paths)
+
+
+@lru_cache(maxsize=16384)
+def normalize_internal_href(href: str) -> Optional[str]:
+    """Return the comparable path of an internal link, or None for external, mailto, tel and anchor-only links.
+
+    Navigation and footer links repeat on every page, so results are cached.
+    """
+    if href.startswith(("#", "mailto:", "tel:")):
+        return None
+
+    if href[:1] == "/" and href[1:2] != "/" and not any(char in href for char in ROOT_PATH_SLOW_CHARS):
+        # Root-relative path (the common case): no scheme or netloc, so cut at the query/fragment
+        # directly instead of building a full urlparse() result
+        end = len(href)
+        for delimiter in "?#":
+            index = href.find(delimiter, 0, end)
+            if index >= 0:
+                end = index
+        clean_path = href[:end]
+    else:
+        parsed_href = urlparse(href)
+        if parsed_href.scheme:
+            return None
+        clean_path = parsed_href.path
+    
+    # Remove trailing slash for comparison
+    if len(clean_path) > 1 and clean_path.endswith('/'):
+        clean_path = clean_path[:-1]
+
+    return clean_path
+
+
+def find_broken_links(file_path: Path, source_page: str, all_pages: FrozenSet[str]) -> List[Tuple[str, str]]:
+    """Return (source page, href) for every internal link in an HTML file that matches no known route."""
+    broken_links = []
+
+    for href in read_hrefs(file_path):
+        clean_path = normalize_internal_href(href)
+        if clean_path is None:
+            continue
+
+        if clean_path not in all_pages:
+            broken_links.append((source_page, href))
+
+    return broken_links
+
+
 def main():
     """Main validation function."""
     build_dir = Path(".next/server/pages")
@@ -31,9 +191,13 @@ def main():
         print("No HTML files found in build directory.")
         return 1
 
+    # Overlap cold-cache disk reads (e.g. CI) with route discovery and parsing; runs before the pool forks
+    prewarm_files(html_files)
+
     # Create a set of all valid page paths for quick lookups
     # Example: /about, /blog/my-post
     all_pages = set()
+    page_urls = {}
     for file_path in html_files:
         relative_path = file_path.relative_to(build_dir)
         # Convert file path to URL path
@@ -41,6 +205,10 @@ def main():
         if url_path.endswith("/index"):
             url_path = url_path[:-5] or "/"
         all_pages.add(url_path)
+        page_urls[file_path] = url_path
+        # Nested index pages map to "/blog/", but links are compared without the trailing slash
+        if len(url_path) > 1 and url_path.endswith("/"):
+            all_pages.add(url_path[:-1])
     
     # Add static files from public directory (or .next/standalone/public) (e.g., /llms.txt, /robots.txt)
     if public_dir.exists():
@@ -51,37 +219,21 @@ def main():
                 url_path = "/" + str(relative_path)
                 all_pages.add(url_path)
 
+    # Every lookup below is a single membership test against the frozen route set
+    all_pages = frozenset(all_pages)
+
     print(f"📄 Found {len(html_files)} pages to validate")
     print(f"🔗 Tracking {len(all_pages)} unique internal routes (HTML + static files)")
     print("=" * 50)
 
     all_broken_links = []
 
-    for file_path in html_files:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            soup = BeautifulSoup(content, "html.parser")
-            
-            for link in soup.find_all("a", href=True):
-                href = link["href"]
-                
-                # Ignore external links, mailto, tel, and anchor-only links
-                if urlparse(href).scheme or href.startswith("#") or href.startswith("mailto:") or href.startswith("tel:"):
-                    continue
-
-                # Normalize internal link path
-                parsed_href = urlparse(href)
-                clean_path = parsed_href.path
-                
-                # Remove trailing slash for comparison
-                if len(clean_path) > 1 and clean_path.endswith('/'):
-                    clean_path = clean_path[:-1]
-
-                if clean_path not in all_pages:
-                    source_page = "/" + str(file_path.relative_to(build_dir).with_suffix(''))
-                    if source_page.endswith("/index"):
-                        source_page = source_page[:-5] or "/"
-                    all_broken_links.append((source_page, href))
+    # Pages are independent, so scan them across all CPU cores
+    check_page = partial(find_broken_links, all_pages=all_pages)
+    source_pages = [page_urls[file_path] for file_path in html_files]
+    with ProcessPoolExecutor() as executor:
+        for broken_links in executor.map(check_page, html_files, source_pages, chunksize=16):
+            all_broken_links.extend(broken_links)
 
     print("\n📊 VALIDATION RESULTS")
     print("=" * 50)
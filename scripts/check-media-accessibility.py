@@ -12,11 +12,16 @@ Exit codes:
 1 - Media accessibility violations found
 """
 
+import mmap
 import os
 import re
 import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import accumulate
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 # ANSI color codes
 RESET = "\033[0m"
@@ -26,14 +31,43 @@ GREEN = "\033[32m"
 YELLOW = "\033[33m"
 CYAN = "\033[36m"
 
+# Source directories to scan and the file suffix checked in each
+SCAN_DIRS = (('components', '.tsx'), ('pages', '.tsx'), ('content', '.mdx'))
+
+# Files at least this large are probed for media through a memory map
+MMAP_THRESHOLD = 64 * 1024
+
+# Precompiled patterns shared by the media checkers. The per-element attribute
+# patterns are matched against lowercased element text, so they are case-sensitive.
+VIDEO_OPEN_RE = re.compile(r'<video[^>]*>', re.IGNORECASE)
+VIDEO_CLOSE_RE = re.compile(r'</video>', re.IGNORECASE)
+AUDIO_OPEN_RE = re.compile(r'<audio[^>]*>', re.IGNORECASE)
+AUDIO_CLOSE_RE = re.compile(r'</audio>', re.IGNORECASE)
+IFRAME_OPEN_RE = re.compile(r'<iframe[^>]*(?:youtube|vimeo)[^>]*>', re.IGNORECASE)
+IFRAME_CLOSE_RE = re.compile(r'</iframe>', re.IGNORECASE)
+CAPTIONS_TRACK_RE = re.compile(r'<track[^>]*kind=["\']captions["\']')
+DESCRIPTIONS_TRACK_RE = re.compile(r'<track[^>]*kind=["\']descriptions["\']')
+CONTROLS_RE = re.compile(r'\bcontrols\b')
+AUTOPLAY_RE = re.compile(r'\bautoplay\b')
+MUTED_RE = re.compile(r'\bmuted\b')
+TITLE_ATTR_RE = re.compile(r'\btitle=')
+ARIA_DESC_RE = re.compile(r'aria-label|video[-\s]description', re.IGNORECASE)
+TRANSCRIPT_RE = re.compile(r'transcript', re.IGNORECASE)
+CC_LOAD_RE = re.compile(r'cc_load_policy=1')
+MEDIA_PROBE_RE = re.compile(r'<(?:video|audio|iframe)', re.IGNORECASE)
+MEDIA_PROBE_BYTES_RE = re.compile(MEDIA_PROBE_RE.pattern.encode(), re.IGNORECASE)
+VIDEO_PROBE_RE = re.compile(r'<video', re.IGNORECASE)
+AUDIO_PROBE_RE = re.compile(r'<audio', re.IGNORECASE)
+IFRAME_PROBE_RE = re.compile(r'<iframe[^>]*(?:youtube|vimeo)', re.IGNORECASE)
+
+@dataclass(frozen=True, slots=True)
 class MediaViolation:
-    def __init__(self, name: str, file: str, severity: str, description: str, wcag: str, line_num: int = 0):
-        self.name = name
-        self.file = file
-        self.severity = severity
-        self.description = description
-        self.wcag = wcag
-        self.line_num = line_num
+    name: str
+    file: str
+    severity: str
+    description: str
+    wcag: str
+    line_num: int = 0
 
 def print_header():
     print("\n" + "=" * 85)
@@ -41,42 +75,69 @@ def print_header():
     print("=" * 85)
 
 def print_results(violations: List[MediaViolation], total_files: int, has_media: bool):
-    print(f"\n{BOLD}Check                                          File                    Status{RESET}")
-    print("-" * 85)
+    # Build the table and write it at once rather than a print() per line
+    output = [f"\n{BOLD}Check                                          File                    Status{RESET}", "-" * 85]
     
     if not has_media:
-        print(f"{'No audio/video content found'.ljust(43)} {'N/A'.ljust(20)} {GREEN}✅ PASS{RESET}")
-        print(f"{YELLOW}   (Validation will run when media is added){RESET}")
+        output.append(f"{'No audio/video content found'.ljust(43)} {'N/A'.ljust(20)} {GREEN}✅ PASS{RESET}")
+        output.append(f"{YELLOW}   (Validation will run when media is added){RESET}")
     elif not violations:
-        print(f"{'All media has proper accessibility'.ljust(43)} {'N/A'.ljust(20)} {GREEN}✅ PASS{RESET}")
+        output.append(f"{'All media has proper accessibility'.ljust(43)} {'N/A'.ljust(20)} {GREEN}✅ PASS{RESET}")
     else:
+        warn_icon = f"{YELLOW}⚠️  WARN{RESET}"
+        fail_icon = f"{RED}❌ FAIL{RESET}"
         for violation in violations:
             file_name = os.path.basename(violation.file).ljust(20)
             check_name = violation.name[:43].ljust(43)
-            status_icon = f"{YELLOW}⚠️  WARN{RESET}" if violation.severity == "warning" else f"{RED}❌ FAIL{RESET}"
-            print(f"{check_name} {file_name} {status_icon}")
+            status_icon = warn_icon if violation.severity == "warning" else fail_icon
+            output.append(f"{check_name} {file_name} {status_icon}")
             if violation.line_num > 0:
-                print(f"  {YELLOW}└─ Line {violation.line_num}: {violation.description}{RESET}")
+                output.append(f"  {YELLOW}└─ Line {violation.line_num}: {violation.description}{RESET}")
             else:
-                print(f"  {YELLOW}└─ {violation.description}{RESET}")
+                output.append(f"  {YELLOW}└─ {violation.description}{RESET}")
     
-    print("=" * 85)
+    output.append("=" * 85)
+    sys.stdout.write('\n'.join(output) + '\n')
+
+def get_line_starts(lines: List[str]) -> List[int]:
+    """Offset of the first character of each line, plus a sentinel one past the end of the content."""
+    return [0, *accumulate(len(line) + 1 for line in lines)]
+
+def line_number(line_starts: List[int], offset: int) -> int:
+    """1-based line number of a character offset in the content."""
+    return bisect_right(line_starts, offset)
+
+def find_elements(content: str, open_re: re.Pattern, close_re: re.Pattern) -> Iterator[Tuple[int, int]]:
+    """Yield (start, end) spans of elements, pairing each opening tag with the next closing tag.
 
-def check_video_element(file_path: str, content: str) -> List[MediaViolation]:
+    Once no closing tag follows an opening tag, none follows any later one either, so the
+    scan stops there instead of rescanning to the end of the file for each of them.
+    """
+    pos = 0
+    while True:
+        open_match = open_re.search(content, pos)
+        if not open_match:
+            return
+        close_match = close_re.search(content, open_match.end())
+        if not close_match:
+            return
+        yield open_match.start(), close_match.end()
+        pos = close_match.end()
+
+def check_video_element(file_path: str, content: str, line_starts: List[int]) -> List[MediaViolation]:
     """Check <video> elements for required accessibility features."""
     violations = []
     file_name = os.path.basename(file_path)
     
     # Find all <video> tags
-    video_pattern = r'<video[^>]*>.*?</video>'
-    videos = re.finditer(video_pattern, content, re.DOTALL | re.IGNORECASE)
+    videos = find_elements(content, VIDEO_OPEN_RE, VIDEO_CLOSE_RE)
     
-    for match in videos:
-        video_tag = match.group(0)
-        line_num = content[:match.start()].count('\n') + 1
+    for start, end in videos:
+        video_tag = content[start:end].lower()
+        line_num = line_number(line_starts, start)
         
         # Check for captions track (WCAG 1.2.2 Level A - REQUIRED)
-        if not re.search(r'<track[^>]*kind=["\']captions["\']', video_tag, re.IGNORECASE):
+        if not CAPTIONS_TRACK_RE.search(video_tag):
             violations.append(MediaViolation(
                 name="Video without captions",
                 file=file_name,
@@ -87,7 +148,7 @@ def check_video_element(file_path: str, content: str) -> List[MediaViolation]:
             ))
         
         # Check for audio descriptions track (WCAG 1.2.5 Level AA - REQUIRED)
-        if not re.search(r'<track[^>]*kind=["\']descriptions["\']', video_tag, re.IGNORECASE):
+        if not DESCRIPTIONS_TRACK_RE.search(video_tag):
             violations.append(MediaViolation(
                 name="Video without audio descriptions",
                 file=file_name,
@@ -98,7 +159,7 @@ def check_video_element(file_path: str, content: str) -> List[MediaViolation]:
             ))
         
         # Check for controls attribute
-        if not re.search(r'\bcontrols\b', video_tag, re.IGNORECASE):
+        if not CONTROLS_RE.search(video_tag):
             violations.append(MediaViolation(
                 name="Video without controls",
                 file=file_name,
@@ -109,8 +170,8 @@ def check_video_element(file_path: str, content: str) -> List[MediaViolation]:
             ))
         
         # Check for autoplay with sound (WCAG 2.2.2 Level A)
-        if re.search(r'\bautoPlay\b', video_tag, re.IGNORECASE):
-            if not re.search(r'\bmuted\b', video_tag, re.IGNORECASE):
+        if AUTOPLAY_RE.search(video_tag):
+            if not MUTED_RE.search(video_tag):
                 violations.append(MediaViolation(
                     name="Video auto-plays with sound",
                     file=file_name,
@@ -122,21 +183,20 @@ def check_video_element(file_path: str, content: str) -> List[MediaViolation]:
     
     return violations
 
-def check_audio_element(file_path: str, content: str) -> List[MediaViolation]:
+def check_audio_element(file_path: str, content: str, line_starts: List[int]) -> List[MediaViolation]:
     """Check <audio> elements for required accessibility features."""
     violations = []
     file_name = os.path.basename(file_path)
     
-    # Find all <audio> tags
-    audio_pattern = r'<audio[^>]*>.*?</audio>'
-    audios = re.finditer(audio_pattern, content, re.DOTALL | re.IGNORECASE)
+    # Find all <audio> tags; the spans are reused for the transcript check
+    audios = list(find_elements(content, AUDIO_OPEN_RE, AUDIO_CLOSE_RE))
     
-    for match in audios:
-        audio_tag = match.group(0)
-        line_num = content[:match.start()].count('\n') + 1
+    for start, end in audios:
+        audio_tag = content[start:end].lower()
+        line_num = line_number(line_starts, start)
         
         # Check for controls attribute
-        if not re.search(r'\bcontrols\b', audio_tag, re.IGNORECASE):
+        if not CONTROLS_RE.search(audio_tag):
             violations.append(MediaViolation(
                 name="Audio without controls",
                 file=file_name,
@@ -147,7 +207,7 @@ def check_audio_element(file_path: str, content: str) -> List[MediaViolation]:
             ))
         
         # Check for autoplay (should be avoided)
-        if re.search(r'\bautoPlay\b', audio_tag, re.IGNORECASE):
+        if AUTOPLAY_RE.search(audio_tag):
             violations.append(MediaViolation(
                 name="Audio auto-plays",
                 file=file_name,
@@ -160,13 +220,12 @@ def check_audio_element(file_path: str, content: str) -> List[MediaViolation]:
     # Check for transcript link near audio element (WCAG 1.2.1 Level A)
     if audios:
         # Look for transcript links within 500 characters of audio tag
-        for match in re.finditer(audio_pattern, content, re.DOTALL | re.IGNORECASE):
-            start = max(0, match.start() - 500)
-            end = min(len(content), match.end() + 500)
-            context = content[start:end]
+        for audio_start, audio_end in audios:
+            start = max(0, audio_start - 500)
+            end = min(len(content), audio_end + 500)
             
-            if not re.search(r'transcript', context, re.IGNORECASE):
-                line_num = content[:match.start()].count('\n') + 1
+            if not TRANSCRIPT_RE.search(content, start, end):
+                line_num = line_number(line_starts, audio_start)
                 violations.append(MediaViolation(
                     name="Audio without transcript link",
                     file=file_name,
@@ -178,21 +237,21 @@ def check_audio_element(file_path: str, content: str) -> List[MediaViolation]:
     
     return violations
 
-def check_iframe_embeds(file_path: str, content: str) -> List[MediaViolation]:
+def check_iframe_embeds(file_path: str, content: str, line_starts: List[int]) -> List[MediaViolation]:
     """Check <iframe> embeds (YouTube, Vimeo) for accessibility."""
     violations = []
     file_name = os.path.basename(file_path)
     
     # Find YouTube/Vimeo iframes
-    iframe_pattern = r'<iframe[^>]*(?:youtube|vimeo)[^>]*>.*?</iframe>'
-    iframes = re.finditer(iframe_pattern, content, re.DOTALL | re.IGNORECASE)
+    iframes = find_elements(content, IFRAME_OPEN_RE, IFRAME_CLOSE_RE)
     
-    for match in iframes:
-        iframe_tag = match.group(0)
-        line_num = content[:match.start()].count('\n') + 1
+    for iframe_start, iframe_end in iframes:
+        iframe_tag = content[iframe_start:iframe_end]
+        iframe_tag_lower = iframe_tag.lower()
+        line_num = line_number(line_starts, iframe_start)
         
         # Check for title attribute
-        if not re.search(r'\btitle=', iframe_tag, re.IGNORECASE):
+        if not TITLE_ATTR_RE.search(iframe_tag_lower):
             violations.append(MediaViolation(
                 name="iframe without title",
                 file=file_name,
@@ -203,11 +262,10 @@ def check_iframe_embeds(file_path: str, content: str) -> List[MediaViolation]:
             ))
         
         # Check for aria-label or description nearby
-        start = max(0, match.start() - 200)
-        end = min(len(content), match.end() + 200)
-        context = content[start:end]
+        start = max(0, iframe_start - 200)
+        end = min(len(content), iframe_end + 200)
         
-        if not re.search(r'aria-label|video[-\s]description', context, re.IGNORECASE):
+        if not ARIA_DESC_RE.search(content, start, end):
             violations.append(MediaViolation(
                 name="iframe without description",
                 file=file_name,
@@ -218,8 +276,8 @@ def check_iframe_embeds(file_path: str, content: str) -> List[MediaViolation]:
             ))
         
         # Check for YouTube captions enabled
-        if 'youtube' in iframe_tag.lower():
-            if not re.search(r'cc_load_policy=1', iframe_tag):
+        if 'youtube' in iframe_tag_lower:
+            if not CC_LOAD_RE.search(iframe_tag):
                 violations.append(MediaViolation(
                     name="YouTube without captions enabled",
                     file=file_name,
@@ -245,40 +303,106 @@ def check_transcript_files(content_dir: str = "content") -> List[MediaViolation]
     
     return violations
 
+def find_source_files(root_dir: str, suffix: str) -> List[str]:
+    """Recursively list files under root_dir ending in suffix, in Path.rglob order."""
+    files = []
+    pending = [root_dir]
+    while pending:
+        directory = pending.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like rglob, don't follow directory symlinks
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(suffix):
+                        files.append(entry.path)
+        except FileNotFoundError:
+            continue
+        # Visit subdirectories depth-first in listing order
+        pending.extend(reversed(subdirs))
+    return files
+
+def read_media_source(file_path: str) -> Optional[str]:
+    """Return the file's text, or None when it has no media tags at all.
+
+    Large files are probed through a read-only memory map, so media-free ones are never decoded.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            content = f.read().decode('utf-8')
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if not MEDIA_PROBE_BYTES_RE.search(mapped):
+                    return None
+                content = mapped[:].decode('utf-8')
+    
+    # Match text-mode reads, which translate \r\n and \r to \n
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    
+    # Most files contain no media at all; one scan rules them out
+    if not MEDIA_PROBE_RE.search(content):
+        return None
+    return content
+
+def scan_file(file_path: str) -> Tuple[List[MediaViolation], bool, Optional[str]]:
+    """Check one file, returning its violations, whether it has media, and any read error."""
+    violations = []
+    
+    try:
+        content = read_media_source(file_path)
+    except Exception as e:
+        return violations, False, str(e)
+    
+    if content is None:
+        return violations, False, None
+    
+    # Check for media elements
+    has_video = bool(VIDEO_PROBE_RE.search(content))
+    has_audio = bool(AUDIO_PROBE_RE.search(content))
+    has_iframe = bool(IFRAME_PROBE_RE.search(content))
+    
+    if not (has_video or has_audio or has_iframe):
+        return violations, False, None
+    
+    # Run only the checks whose element was found
+    line_starts = get_line_starts(content.split('\n'))
+    if has_video:
+        violations.extend(check_video_element(file_path, content, line_starts))
+    if has_audio:
+        violations.extend(check_audio_element(file_path, content, line_starts))
+    if has_iframe:
+        violations.extend(check_iframe_embeds(file_path, content, line_starts))
+    
+    # Elements sharing a line report the same violation once. Deduplicate per file,
+    # since MediaViolation.file is only the base name and may repeat across directories.
+    return list(dict.fromkeys(violations)), True, None
+
 def scan_files() -> Tuple[List[MediaViolation], int, bool]:
     """Scan all TypeScript component and page files for media elements."""
     violations = []
     has_media = False
     
-    # Get all .tsx files in components/ and pages/
-    component_files = list(Path('components').rglob('*.tsx'))
-    page_files = list(Path('pages').rglob('*.tsx'))
-    mdx_files = list(Path('content').rglob('*.mdx')) if Path('content').exists() else []
-    all_files = component_files + page_files + mdx_files
+    # Get all .tsx files in components/ and pages/, and .mdx files in content/
+    all_files = []
+    for root_dir, suffix in SCAN_DIRS:
+        all_files.extend(find_source_files(root_dir, suffix))
     
     print(f"\n{CYAN}📂 Scanning files for audio/video content...{RESET}")
     print(f"   Found {len(all_files)} files to check\n")
     
-    for file_path in all_files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            print(f"{RED}Error reading {file_path}: {e}{RESET}")
-            continue
-        
-        # Check for media elements
-        has_video = bool(re.search(r'<video', content, re.IGNORECASE))
-        has_audio = bool(re.search(r'<audio', content, re.IGNORECASE))
-        has_iframe = bool(re.search(r'<iframe[^>]*(?:youtube|vimeo)', content, re.IGNORECASE))
-        
-        if has_video or has_audio or has_iframe:
-            has_media = True
-        
-        # Run checks
-        violations.extend(check_video_element(str(file_path), content))
-        violations.extend(check_audio_element(str(file_path), content))
-        violations.extend(check_iframe_embeds(str(file_path), content))
+    # Files are independent, so scan them in parallel; map keeps results in file order
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(scan_file, all_files, chunksize=16)
+        for file_path, (file_violations, file_has_media, error) in zip(all_files, results):
+            if error:
+                print(f"{RED}Error reading {file_path}: {error}{RESET}")
+                continue
+            violations.extend(file_violations)
+            has_media = has_media or file_has_media
     
     return violations, len(all_files), has_media
 
@@ -288,9 +412,14 @@ def main():
     
     violations, total_files, has_media = scan_files()
     
-    # Separate errors and warnings
-    errors = [v for v in violations if v.severity == "error"]
-    warnings = [v for v in violations if v.severity == "warning"]
+    # Count errors and warnings in one pass
+    error_count = 0
+    warning_count = 0
+    for violation in violations:
+        if violation.severity == "error":
+            error_count += 1
+        elif violation.severity == "warning":
+            warning_count += 1
     
     print_results(violations, total_files, has_media)
     
@@ -301,14 +430,14 @@ def main():
         print(f"   {CYAN}ℹ️  This script will validate media when it's added{RESET}")
     else:
         print(f"   {CYAN}📹 Media files found: Yes{RESET}")
-        if errors:
-            print(f"   {RED}❌ Errors found: {len(errors)}{RESET}")
-        if warnings:
-            print(f"   {YELLOW}⚠️  Warnings: {len(warnings)}{RESET}")
+        if error_count:
+            print(f"   {RED}❌ Errors found: {error_count}{RESET}")
+        if warning_count:
+            print(f"   {YELLOW}⚠️  Warnings: {warning_count}{RESET}")
         if not violations:
             print(f"   {GREEN}✅ All media properly accessible{RESET}")
     
-    if errors:
+    if error_count:
         print(f"\n{RED}{BOLD}❌ TIME-BASED MEDIA VALIDATION FAILED{RESET}")
         print(f"\n{YELLOW}📋 Required Actions:{RESET}")
         print("   1. Add <track kind='captions'> to all videos")
@@ -320,7 +449,7 @@ def main():
         print("\n" + "=" * 85)
         sys.exit(1)
     
-    if warnings:
+    if warning_count:
         print(f"\n{YELLOW}⚠️  PASSED WITH WARNINGS{RESET}")
         print("   Review warnings and consider improving media accessibility\n")
         print("=" * 85)
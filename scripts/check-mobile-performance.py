@@ -6,11 +6,15 @@ Validates Next.js Image components for mobile optimization:
 - All Image components must have sizes prop (responsive optimization)
 - Viewport meta tag present (mobile rendering)
 - Base font size meets 16px minimum (readability)
+
+Set CI_FAIL_FAST=1 to stop the Image scan at the first missing sizes prop.
 """
 
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 # ANSI color codes
@@ -20,58 +24,78 @@ YELLOW = "\033[93m"
 BLUE = "\033[94m"
 RESET = "\033[0m"
 
-def find_files_with_images():
-    """Find all TypeScript files that import Next.js Image component."""
-    files_with_images = []
+# Precompiled patterns
+IMAGE_TAG_RE = re.compile(r'<Image\s([^>]*)')  # group 1: attributes up to the closing >
+HTML_FONT_SIZE_RE = re.compile(r'html\s*{[^}]*font-size:\s*(\d+)px')
+BODY_FONT_SIZE_RE = re.compile(r'body\s*{[^}]*font-size:\s*(\d+)px')
+
+def find_tsx_files(directory):
+    """Recursively list .tsx files under directory in os.walk order."""
+    tsx_files = []
+    pending = [directory]
     
-    for directory in ['pages', 'components']:
-        if not os.path.exists(directory):
+    while pending:
+        subdirs = []
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, don't follow directory symlinks
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith('.tsx'):
+                        tsx_files.append(entry.path)
+        except FileNotFoundError:
             continue
-            
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if file.endswith('.tsx'):
-                    filepath = os.path.join(root, file)
-                    try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            if "from 'next/image'" in content or 'from "next/image"' in content:
-                                files_with_images.append(filepath)
-                    except Exception as e:
-                        print(f"{YELLOW}Warning: Could not read {filepath}: {e}{RESET}")
-    
-    return files_with_images
+        pending.extend(reversed(subdirs))
+    
+    return tsx_files
 
-def check_image_sizes_prop(filepath):
-    """Check if all Image components in a file have sizes prop."""
+def find_candidate_files():
+    """Find all TypeScript files that may use the Next.js Image component."""
+    candidate_files = []
+    
+    for directory in ['pages', 'components']:
+        candidate_files.extend(find_tsx_files(directory))
+    
+    return candidate_files
+
+def check_image_sizes_prop(filepath, fast_fail=False):
+    """Check if all Image components in a file have sizes prop.
+    
+    Returns (result, error). result is None for files that don't import
+    Next.js Image or can't be read, so each file is read once for both the
+    import probe and the tag scan. error is a warning for the caller to
+    print ('' if none). With fast_fail, stop at the first Image missing
+    sizes (missing is then 1).
+    """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Count Image components (simple regex - may have false positives)
-        image_components = re.findall(r'<Image\s', content)
-        image_count = len(image_components)
-        
-        if image_count == 0:
-            return {'file': filepath, 'total': 0, 'with_sizes': 0, 'missing': 0}
+        with open(filepath, 'rb') as f:
+            raw = f.read()
         
-        # Count Image components with sizes prop
-        # This checks for sizes= within 10 lines after <Image
-        # Simple approach: split by <Image and check if sizes= appears before next >
+        # Probe the raw bytes; only files that import Image need their content,
+        # but every file must still decode as UTF-8 (ASCII always does)
+        has_import = b"from 'next/image'" in raw or b'from "next/image"' in raw
+        if has_import or not raw.isascii():
+            content = raw.decode('utf-8')
+    except Exception as e:
+        return None, f"Could not read {filepath}: {e}"
+    
+    if not has_import:
+        return None, ''
+    
+    try:
+        # Count Image components (simple regex - may have false positives),
+        # and those whose opening tag has a sizes prop before its closing >
+        image_count = 0
         sizes_count = 0
-        parts = content.split('<Image')
         
-        for part in parts[1:]:  # Skip first part (before first <Image)
-            # Get content until we find the closing of the Image tag
-            # Look for either /> or > that closes the tag
-            tag_end = min(
-                part.find('/>') if part.find('/>') != -1 else len(part),
-                part.find('>') if part.find('>') != -1 else len(part)
-            )
-            tag_content = part[:tag_end]
-            
-            if 'sizes=' in tag_content:
+        for match in IMAGE_TAG_RE.finditer(content):
+            image_count += 1
+            if 'sizes=' in match.group(1):
                 sizes_count += 1
+            elif fast_fail:
+                break
         
         missing = image_count - sizes_count
         
@@ -80,11 +104,10 @@ def check_image_sizes_prop(filepath):
             'total': image_count,
             'with_sizes': sizes_count,
             'missing': missing
-        }
+        }, ''
     
     except Exception as e:
-        print(f"{YELLOW}Warning: Error checking {filepath}: {e}{RESET}")
-        return {'file': filepath, 'total': 0, 'with_sizes': 0, 'missing': 0}
+        return {'file': filepath, 'total': 0, 'with_sizes': 0, 'missing': 0}, f"Error checking {filepath}: {e}"
 
 def check_viewport_meta():
     """Check if viewport meta tag is present in _document.tsx."""
@@ -120,8 +143,8 @@ def check_font_size():
             content = f.read()
         
         # Check if there's a font-size override on html/body that's less than 16px
-        html_font_match = re.search(r'html\s*{[^}]*font-size:\s*(\d+)px', content)
-        body_font_match = re.search(r'body\s*{[^}]*font-size:\s*(\d+)px', content)
+        html_font_match = HTML_FONT_SIZE_RE.search(content)
+        body_font_match = BODY_FONT_SIZE_RE.search(content)
         
         if html_font_match:
             size = int(html_font_match.group(1))
@@ -146,14 +169,31 @@ def main():
     
     # Check 1: Image sizes prop
     print(f"{BLUE}📱 Checking Next.js Image components for sizes prop...{RESET}")
-    files_with_images = find_files_with_images()
+    fast_fail = os.environ.get('CI_FAIL_FAST') == '1'
+    check = partial(check_image_sizes_prop, fast_fail=fast_fail)
+    results = []
+    
+    # Files are independent, so check them in parallel; map keeps results in file order
+    with ProcessPoolExecutor() as executor:
+        for result, error in executor.map(check, find_candidate_files(), chunksize=16):
+            # Workers return their warnings so they print in file order
+            if error:
+                print(f"{YELLOW}Warning: {error}{RESET}")
+            if result is None:
+                continue
+            results.append(result)
+            if fast_fail and result['missing'] > 0:
+                # One failure decides the check; drop the files not yet started
+                executor.shutdown(cancel_futures=True)
+                break
+    
+    files_with_images = [result['file'] for result in results]
     
     if not files_with_images:
         print(f"{YELLOW}No files found with Next.js Image imports{RESET}")
         image_check_passed = True
         missing_sizes_total = 0
     else:
-        results = [check_image_sizes_prop(f) for f in files_with_images]
         missing_sizes_total = sum(r['missing'] for r in results)
         total_images = sum(r['total'] for r in results)
         
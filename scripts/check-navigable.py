@@ -21,14 +21,21 @@ Usage:
 import os
 import sys
 import re
+import mmap
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import accumulate
 from pathlib import Path
-from typing import List, Dict, Tuple, Set
+from typing import Callable, Iterator, List, Dict, Tuple, Set, Match, Pattern
 
-# File patterns to scan
-INCLUDE_PATTERNS = [
-    'pages/**/*.tsx',
-    'components/**/*.tsx',
-]
+# Directories to scan recursively, and the file suffix to validate in them
+INCLUDE_DIRS = ('pages', 'components')
+INCLUDE_SUFFIX = '.tsx'
+
+# File patterns to scan (for display)
+INCLUDE_PATTERNS = [f'{directory}/**/*{INCLUDE_SUFFIX}' for directory in INCLUDE_DIRS]
 
 # Files to exclude from validation
 EXCLUDE_FILES = {
@@ -39,49 +46,209 @@ EXCLUDE_FILES = {
     'pages/_document.tsx',
 }
 
+# Files at least this large are probed through a memory map before being decoded
+MMAP_THRESHOLD = 64 * 1024
+
+# Link text that does not describe the link purpose (SC 2.4.4)
+GENERIC_LINK_TEXT = frozenset({
+    'click here',
+    'click',
+    'here',
+    'read more',
+    'more',
+    'link',
+    'continue',
+})
+
+# Heading text that is a leftover placeholder (SC 2.4.6)
+PLACEHOLDER_HEADINGS = frozenset({
+    'heading',
+    'title',
+    'placeholder',
+    'todo',
+    'tbd',
+    'test',
+})
+
+# Precompiled patterns shared by the checks
+SKIP_LINK_RE = re.compile(r'href=["\'](#main|#content)["\']', re.IGNORECASE)
+MAIN_LANDMARK_RE = re.compile(r'<main\s')
+NAVIGATION_RE = re.compile(r'<Navigation\s|<nav\s', re.IGNORECASE)
+SEO_RE = re.compile(r'<SEO\s')
+SEO_PROPS_RE = re.compile(r'<SEO\s+([^>]*?)/?>', re.DOTALL)
+TABINDEX_RE = re.compile(r'tabIndex[^\S\n]*=[^\S\n]*["{](\d+)["}]')  # [^\S\n]: stays within one line
+# Element opening tags; iter_elements pairs each with its closing tag
+LINK_OPEN_RE = re.compile(r'<Link\s+([^>]*?)>')
+LINK_CLOSE_RE = re.compile(r'</Link>')
+ARIA_LABEL_ATTR_RE = re.compile(r'aria-label\s*=')
+TITLE_ATTR_RE = re.compile(r'title\s*=')
+# Icon components, SVG, Logo and Image components
+ICON_STRIP_RE = re.compile(
+    r'<[A-Z][a-zA-Z]*Icon[^>]*/?>|<svg[^>]*>.*?</svg>|<Logo[^>]*/?>|<Image[^>]*/?>',
+    re.DOTALL
+)
+TAG_RE = re.compile(r'<[^>]+>')
+JSX_EXPRESSION_RE = re.compile(r'{[^}]+}')
+# Tags are dropped, JSX expressions (group 1) count as text
+TAG_OR_JSX_RE = re.compile(r'<[^>]+>|({[^}]+})')
+PAGE_HEADER_RE = re.compile(r'<PageHeader\s')
+BREADCRUMBS_PROP_RE = re.compile(r'breadcrumbs\s*=')
+HEADING_OPEN_RE = re.compile(r'<h([1-6])[^>]*>', re.IGNORECASE)
+HEADING_CLOSE_RES = {level: re.compile(f'</h{level}>', re.IGNORECASE) for level in '123456'}
+LABEL_OPEN_RE = re.compile(r'<label[^>]*>', re.IGNORECASE)
+LABEL_CLOSE_RE = re.compile(r'</label>', re.IGNORECASE)
+# Trigger text of the case-insensitive checks; str IGNORECASE also folds İ and ı to i
+HEADINGS_LABELS_TRIGGER_RE = re.compile(r'<h|<label', re.IGNORECASE)
+OUTLINE_TRIGGER_RE = re.compile(r'outline', re.IGNORECASE)
+# Trigger text of the content-gated checks (see iter_file_issues); a component without any of it has nothing
+# to check. Bytes IGNORECASE is ASCII-only, so the UTF-8 forms of İ and ı also count as a possible trigger
+CHECK_TRIGGER_BYTES_RE = re.compile(rb'tabIndex|<Link|<PageHeader|(?i:<h|<label|outline)|\xc4[\xb0\xb1]')
+OUTLINE_NONE_RE = re.compile(r'outline[^\S\n]*:[^\S\n]*(none|0)', re.IGNORECASE)  # [^\S\n]: stays within one line
+FOCUS_VISIBLE_RE = re.compile(r'focus-visible:', re.IGNORECASE)
+CUSTOM_FOCUS_RE = re.compile(r'(ring|border|shadow|box-shadow)', re.IGNORECASE)
+FOCUS_STYLES_RE = re.compile(r'(focus:|focus-visible:|focus-within:)', re.IGNORECASE)
+
+@dataclass(frozen=True, slots=True)
 class NavigableIssue:
-    """Represents a navigable accessibility issue"""
-    def __init__(self, file_path: str, line_num: int, issue_type: str, message: str, sc: str):
-        """Initialize a navigable accessibility issue.
-        
-        Args:
-            file_path: Path to the file containing the issue
-            line_num: Line number where issue occurs
-            issue_type: Type of navigable issue
-            message: Description of the issue
-            sc: WCAG Success Criterion reference
-        """
-        self.file_path = file_path
-        self.line_num = line_num
-        self.issue_type = issue_type
-        self.message = message
-        self.sc = sc  # Success Criterion
+    """Represents a navigable accessibility issue
+    
+    Attributes:
+        file_path: Path to the file containing the issue
+        line_num: Line number where issue occurs
+        issue_type: Type of navigable issue
+        message: Description of the issue
+        sc: WCAG Success Criterion reference
+    """
+    file_path: str
+    line_num: int
+    issue_type: str
+    message: str
+    sc: str  # Success Criterion
+
+def walk_files(root_dir: str, directory: str, suffix: str, excluded: Set[str]) -> List[str]:
+    """Recursively list files ending in suffix with os.scandir, returning plain path strings
+    
+    Entries whose path relative to root_dir is in excluded are skipped; excluded
+    directories are pruned without being scanned.
+    """
+    files = []
+    relative_start = len(root_dir) + 1
+    pending = [os.path.join(root_dir, directory)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.path[relative_start:] in excluded:
+                        continue
+                    if entry.is_dir():
+                        # Like Path.glob('**'), don't follow directory symlinks
+                        if not entry.is_symlink():
+                            pending.append(entry.path)
+                    elif entry.name.endswith(suffix):
+                        files.append(entry.path)
+        except FileNotFoundError:
+            continue
+    return files
+
+@dataclass(frozen=True, slots=True)
+class FileContext:
+    """Path-based classification of a file, computed once and shared by all checks
+    
+    Attributes:
+        path: File path as reported in issues
+        is_layout: File is a Layout component
+        is_page: File is a Next.js page (not an API route)
+        is_index: File is the landing page
+    """
+    path: str
+    is_layout: bool
+    is_page: bool
+    is_index: bool
+    
+    @classmethod
+    def from_path(cls, file_path: Path) -> 'FileContext':
+        path = str(file_path)
+        return cls(
+            path=path,
+            is_layout='Layout.tsx' in path,
+            is_page='pages/' in path and 'pages/api/' not in path,
+            is_index='pages/index.tsx' in path,
+        )
 
 def scan_files(root_dir: Path) -> List[Path]:
     """Scan for TypeScript/TSX files to validate"""
     files = []
-    for pattern in INCLUDE_PATTERNS:
-        files.extend(root_dir.glob(pattern))
+    for directory in INCLUDE_DIRS:
+        files.extend(Path(path) for path in walk_files(str(root_dir), directory, INCLUDE_SUFFIX, EXCLUDE_FILES))
     
-    # Filter out excluded files
-    filtered_files = []
-    for file_path in files:
-        relative_path = str(file_path.relative_to(root_dir))
-        if not any(excluded in relative_path for excluded in EXCLUDE_FILES):
-            filtered_files.append(file_path)
-    
-    return sorted(filtered_files)
+    return sorted(files)
 
-def read_file_lines(file_path: Path) -> List[str]:
-    """Read file and return lines"""
+def read_file(file_path: Path, ctx: FileContext) -> str:
+    """Read file and return its content
+    
+    Large components come back empty, undecoded, when no check applies to them
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.readlines()
+        with open(file_path, 'rb') as f:
+            if ctx.is_page or ctx.is_layout or os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                content = f.read().decode('utf-8')
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if not CHECK_TRIGGER_BYTES_RE.search(mapped):
+                        return ''
+                    content = mapped[:].decode('utf-8')
     except Exception as e:
         print(f"Error reading {file_path}: {e}", file=sys.stderr)
-        return []
+        return ''
+    
+    # Match text-mode reads, which translate \r\n and \r to \n
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+def get_line_starts(lines: List[str]) -> List[int]:
+    """Offset of the first character of each line, plus a sentinel one past the end of the content"""
+    return [0, *accumulate(len(line) + 1 for line in lines)]
 
-def check_bypass_blocks(file_path: Path, lines: List[str]) -> List[NavigableIssue]:
+def line_number(line_starts: List[int], offset: int) -> int:
+    """1-based line number of a character offset in the content"""
+    return bisect_right(line_starts, offset)
+
+def line_context(content: str, line_starts: List[int], start: int, end: int) -> str:
+    """Return lines[start:end] joined by newlines, sliced directly from the file content"""
+    start = max(0, start)
+    end = min(len(line_starts) - 1, end)
+    return content[line_starts[start]:line_starts[end] - 1]
+
+def iter_elements(content: str, open_re: Pattern[str],
+                  close_re_for: Callable[[Match[str]], Pattern[str]]) -> Iterator[Tuple[Match[str], str]]:
+    """Yield (opening tag match, inner content) for each element
+    
+    Pairs every opening tag with the first closing tag after it, like finditer over
+    '<open>(.*?)</close>' with re.DOTALL. Once a closing tag is missing it can't appear
+    later either, so later openings needing it are skipped instead of each rescanning
+    to the end of the file.
+    """
+    unclosed = set()
+    pos = 0
+    while True:
+        open_match = open_re.search(content, pos)
+        if not open_match:
+            return
+        close_re = close_re_for(open_match)
+        close_match = None if close_re in unclosed else close_re.search(content, open_match.end())
+        if close_match is None:
+            unclosed.add(close_re)
+            pos = open_match.start() + 1
+            continue
+        yield open_match, content[open_match.end():close_match.start()]
+        pos = close_match.end()
+
+def link_text_placeholder(match: Match[str]) -> str:
+    """Replacement for TAG_OR_JSX_RE: drop tags, keep JSX expressions as text"""
+    return 'TEXT' if match.group(1) else ''
+
+def check_bypass_blocks(ctx: FileContext, content: str, lines: List[str], line_starts: List[int]) -> Iterator[NavigableIssue]:
     """
     SC 2.4.1 Bypass Blocks (Level A)
     
@@ -93,51 +260,43 @@ def check_bypass_blocks(file_path: Path, lines: List[str]) -> List[NavigableIssu
     - Skip links are typically in Layout or _app components
     - Semantic HTML5 landmarks provide implicit bypass mechanisms
     """
-    issues = []
-    content = ''.join(lines)
+    # Only layouts and pages are checked; most files are other components
+    if not ctx.is_layout and not ctx.is_page:
+        return
     
     # Check if this is Layout component
-    is_layout = 'Layout.tsx' in str(file_path)
-    
-    if is_layout:
+    if ctx.is_layout:
         # Layout should ideally have a skip link, but semantic <main> also satisfies SC 2.4.1
-        has_skip_link = re.search(r'href=["\'](#main|#content)["\']', content, re.IGNORECASE)
-        has_main_landmark = re.search(r'<main\s', content)
-        
-        if not has_skip_link and not has_main_landmark:
-            issues.append(NavigableIssue(
-                file_path=str(file_path),
+        # (the <main> scan only runs when there is no skip link)
+        if not SKIP_LINK_RE.search(content) and not MAIN_LANDMARK_RE.search(content):
+            yield NavigableIssue(
+                file_path=ctx.path,
                 line_num=1,
                 issue_type='bypass_blocks',
                 message='Layout component should have skip link or <main> landmark for bypassing navigation',
                 sc='2.4.1'
-            ))
+            )
     
     # Check for pages with navigation but no main landmark
     # This is a best practice check
-    if 'pages/' in str(file_path) and not 'pages/api/' in str(file_path):
-        has_navigation = re.search(r'<Navigation\s|<nav\s', content, re.IGNORECASE)
-        has_main = re.search(r'<main\s', content)
-        
+    if ctx.is_page:
         # If page has navigation but no main, it might need bypass mechanism
         # However, Layout.tsx wraps pages with <main>, so we check if Layout is used
         uses_layout = 'Layout' in content or 'getStaticProps' in content
         
-        if has_navigation and not has_main and not uses_layout:
+        if not uses_layout and NAVIGATION_RE.search(content) and not MAIN_LANDMARK_RE.search(content):
             for i, line in enumerate(lines, 1):
                 if '<Navigation' in line or '<nav' in line.lower():
-                    issues.append(NavigableIssue(
-                        file_path=str(file_path),
+                    yield NavigableIssue(
+                        file_path=ctx.path,
                         line_num=i,
                         issue_type='bypass_blocks',
                         message='Page with navigation should use Layout component or provide <main> landmark',
                         sc='2.4.1'
-                    ))
+                    )
                     break
-    
-    return issues
 
-def check_page_titled(file_path: Path, lines: List[str]) -> List[NavigableIssue]:
+def check_page_titled(ctx: FileContext, content: str, lines: List[str], line_starts: List[int]) -> Iterator[NavigableIssue]:
     """
     SC 2.4.2 Page Titled (Level A)
     
@@ -149,29 +308,26 @@ def check_page_titled(file_path: Path, lines: List[str]) -> List[NavigableIssue]
     - <SEO> component uses next-seo to set page title
     - Title format: "{page.title} | {siteMetadata.title}" or default
     """
-    issues = []
-    
     # Only check page files (pages/*.tsx), not components
-    if 'pages/' not in str(file_path) or 'pages/api/' in str(file_path):
-        return issues
-    
-    content = ''.join(lines)
+    if not ctx.is_page:
+        return
     
     # Check for SEO component usage
-    has_seo = re.search(r'<SEO\s', content)
+    has_seo = SEO_RE.search(content)
     
     if not has_seo:
-        issues.append(NavigableIssue(
-            file_path=str(file_path),
+        yield NavigableIssue(
+            file_path=ctx.path,
             line_num=1,
             issue_type='page_titled',
             message='Page should use <SEO> component to provide descriptive title',
             sc='2.4.2'
-        ))
-        return issues
+        )
+        return
     
     # Check if SEO has title prop
-    seo_match = re.search(r'<SEO\s+([^>]*?)/?>', content, re.DOTALL)
+    # (any match starts at an <SEO tag, so resume from the first one found above)
+    seo_match = SEO_PROPS_RE.search(content, has_seo.start())
     if seo_match:
         seo_props = seo_match.group(1)
         has_title = 'title=' in seo_props
@@ -179,22 +335,19 @@ def check_page_titled(file_path: Path, lines: List[str]) -> List[NavigableIssue]
         if not has_title:
             # Some pages might use default title (landing page), which is acceptable
             # Only flag if it's not the index page
-            is_index = 'pages/index.tsx' in str(file_path)
-            if not is_index:
+            if not ctx.is_index:
                 for i, line in enumerate(lines, 1):
                     if '<SEO' in line:
-                        issues.append(NavigableIssue(
-                            file_path=str(file_path),
+                        yield NavigableIssue(
+                            file_path=ctx.path,
                             line_num=i,
                             issue_type='page_titled',
                             message='SEO component should have title prop for non-landing pages',
                             sc='2.4.2'
-                        ))
+                        )
                         break
-    
-    return issues
 
-def check_focus_order(file_path: Path, lines: List[str]) -> List[NavigableIssue]:
+def check_focus_order(ctx: FileContext, content: str, lines: List[str], line_starts: List[int]) -> Iterator[NavigableIssue]:
     """
     SC 2.4.3 Focus Order (Level A)
     
@@ -207,26 +360,26 @@ def check_focus_order(file_path: Path, lines: List[str]) -> List[NavigableIssue]
     - Positive tabIndex values disrupt keyboard navigation
     - This overlaps with check-keyboard.py but validates focus sequence specifically
     """
-    issues = []
-    
     # Check for positive tabIndex (anti-pattern)
-    for i, line in enumerate(lines, 1):
-        # Match tabIndex={positive number} or tabIndex="positive number"
-        positive_tabindex = re.search(r'tabIndex\s*=\s*["{](\d+)["}]', line)
-        if positive_tabindex:
-            value = int(positive_tabindex.group(1))
-            if value > 0:
-                issues.append(NavigableIssue(
-                    file_path=str(file_path),
-                    line_num=i,
-                    issue_type='focus_order',
-                    message=f'Positive tabIndex={value} disrupts natural focus order. Use tabIndex=0 or -1',
-                    sc='2.4.3'
-                ))
-    
-    return issues
+    # Match tabIndex={positive number} or tabIndex="positive number" in one pass over the content, once per line
+    last_line = 0
+    for positive_tabindex in TABINDEX_RE.finditer(content):
+        i = line_number(line_starts, positive_tabindex.start())
+        if i == last_line:
+            continue
+        last_line = i
+        
+        value = int(positive_tabindex.group(1))
+        if value > 0:
+            yield NavigableIssue(
+                file_path=ctx.path,
+                line_num=i,
+                issue_type='focus_order',
+                message=f'Positive tabIndex={value} disrupts natural focus order. Use tabIndex=0 or -1',
+                sc='2.4.3'
+            )
 
-def check_link_purpose(file_path: Path, lines: List[str]) -> List[NavigableIssue]:
+def check_link_purpose(ctx: FileContext, content: str, lines: List[str], line_starts: List[int]) -> Iterator[NavigableIssue]:
     """
     SC 2.4.4 Link Purpose in Context (Level A)
     
@@ -239,37 +392,26 @@ def check_link_purpose(file_path: Path, lines: List[str]) -> List[NavigableIssue
     - Link purpose should be clear from link text or surrounding context
     - Generic link text like "click here", "more", "read more" should be avoided
     """
-    issues = []
-    content = ''.join(lines)
-    
     # Find all Link components (multi-line support)
     # Need to handle multi-line Link elements
-    link_pattern = r'<Link\s+([^>]*?)>(.*?)</Link>'
-    links = re.finditer(link_pattern, content, re.DOTALL)
+    links = iter_elements(content, LINK_OPEN_RE, lambda _: LINK_CLOSE_RE)
     
-    for link_match in links:
+    for link_match, link_inner in links:
         link_props = link_match.group(1).strip()  # Props of <Link>
-        link_content = link_match.group(2).strip()  # Content between <Link></Link>
+        link_content = link_inner.strip()  # Content between <Link></Link>
         
         # Check if link has aria-label or title in props
-        has_aria_label_prop = re.search(r'aria-label\s*=', link_props)
-        has_title_prop = re.search(r'title\s*=', link_props)
+        has_aria_label_prop = ARIA_LABEL_ATTR_RE.search(link_props)
+        has_title_prop = TITLE_ATTR_RE.search(link_props)
         
         # Skip links with children components (likely descriptive)
         if '<' in link_content and '>' in link_content:
             # Check if it's ONLY an icon (no text)
             # Remove icon components to see if there's text left
-            content_without_icons = link_content
-            
-            # Remove common icon patterns
-            content_without_icons = re.sub(r'<[A-Z][a-zA-Z]*Icon[^>]*/?>', '', content_without_icons)  # Icon components
-            content_without_icons = re.sub(r'<svg[^>]*>.*?</svg>', '', content_without_icons, flags=re.DOTALL)  # SVG
-            content_without_icons = re.sub(r'<Logo[^>]*/?>', '', content_without_icons)  # Logo component
-            content_without_icons = re.sub(r'<Image[^>]*/?>', '', content_without_icons)  # Image component
+            content_without_icons = ICON_STRIP_RE.sub('', link_content)
             
             # Extract text content
-            text_only = re.sub(r'<[^>]+>', '', content_without_icons)
-            text_only = re.sub(r'{[^}]+}', 'TEXT', text_only)  # JSX expressions count as text
+            text_only = TAG_OR_JSX_RE.sub(link_text_placeholder, content_without_icons)
             text_only = text_only.strip()
             
             # If there's text or JSX expressions, it's fine
@@ -277,46 +419,34 @@ def check_link_purpose(file_path: Path, lines: List[str]) -> List[NavigableIssue
                 continue
             
             # It's icon-only, check for aria-label or title (in props or content)
-            has_aria_label_content = re.search(r'aria-label\s*=', link_content)
-            has_title_content = re.search(r'title\s*=', link_content)
+            has_aria_label_content = ARIA_LABEL_ATTR_RE.search(link_content)
+            has_title_content = TITLE_ATTR_RE.search(link_content)
             
             if not has_aria_label_prop and not has_title_prop and not has_aria_label_content and not has_title_content:
                 # Find the line number
-                line_num = content[:link_match.start()].count('\n') + 1
-                issues.append(NavigableIssue(
-                    file_path=str(file_path),
+                line_num = line_number(line_starts, link_match.start())
+                yield NavigableIssue(
+                    file_path=ctx.path,
                     line_num=line_num,
                     issue_type='link_purpose',
                     message='Icon-only link should have aria-label or title attribute',
                     sc='2.4.4'
-                ))
+                )
             continue
         
         # Check for generic link text (case insensitive)
-        generic_text = [
-            'click here',
-            'click',
-            'here',
-            'read more',
-            'more',
-            'link',
-            'continue',
-        ]
-        
         link_text_lower = link_content.lower().strip()
-        if link_text_lower in generic_text:
-            line_num = content[:link_match.start()].count('\n') + 1
-            issues.append(NavigableIssue(
-                file_path=str(file_path),
+        if link_text_lower in GENERIC_LINK_TEXT:
+            line_num = line_number(line_starts, link_match.start())
+            yield NavigableIssue(
+                file_path=ctx.path,
                 line_num=line_num,
                 issue_type='link_purpose',
                 message=f'Link text "{link_content}" is too generic. Use descriptive text that explains link purpose',
                 sc='2.4.4'
-            ))
-    
-    return issues
+            )
 
-def check_multiple_ways(file_path: Path, lines: List[str]) -> List[NavigableIssue]:
+def check_multiple_ways(ctx: FileContext, content: str, lines: List[str], line_starts: List[int]) -> Iterator[NavigableIssue]:
     """
     SC 2.4.5 Multiple Ways (Level AA)
     
@@ -330,18 +460,12 @@ def check_multiple_ways(file_path: Path, lines: List[str]) -> List[NavigableIssu
     - This is a site-level check, not per-file
     - We validate that components/mechanisms exist
     """
-    issues = []
-    
     # Check for breadcrumbs usage in pages
-    if 'pages/' in str(file_path) and not 'pages/api/' in str(file_path):
-        content = ''.join(lines)
-        is_subpage = not 'pages/index.tsx' in str(file_path)
+    if ctx.is_page:
+        is_subpage = not ctx.is_index
         
         # Sub-pages should use PageHeader with breadcrumbs (best practice)
-        has_page_header = re.search(r'<PageHeader\s', content)
-        has_breadcrumbs_prop = re.search(r'breadcrumbs\s*=', content)
-        
-        if is_subpage and has_page_header and not has_breadcrumbs_prop:
+        if is_subpage and PAGE_HEADER_RE.search(content) and not BREADCRUMBS_PROP_RE.search(content):
             for i, line in enumerate(lines, 1):
                 if '<PageHeader' in line:
                     # This is a suggestion, not a hard error
@@ -349,9 +473,10 @@ def check_multiple_ways(file_path: Path, lines: List[str]) -> List[NavigableIssu
                     # We'll skip this check as it's enforced by types
                     break
     
-    return issues
+    # Nothing is reported yet, but this stays a generator like the other checks
+    yield from ()
 
-def check_headings_labels(file_path: Path, lines: List[str]) -> List[NavigableIssue]:
+def check_headings_labels(ctx: FileContext, content: str, lines: List[str], line_starts: List[int]) -> Iterator[NavigableIssue]:
     """
     SC 2.4.6 Headings and Labels (Level AA)
     
@@ -365,83 +490,67 @@ def check_headings_labels(file_path: Path, lines: List[str]) -> List[NavigableIs
     - Labels describe form controls
     - This overlaps with check-semantic-structure.py but focuses on descriptiveness
     """
-    issues = []
-    content = ''.join(lines)
-    
     # Check for empty or placeholder headings
-    heading_pattern = r'<h([1-6])[^>]*>(.*?)</h\1>'
-    headings = re.finditer(heading_pattern, content, re.DOTALL | re.IGNORECASE)
+    headings = iter_elements(content, HEADING_OPEN_RE, lambda m: HEADING_CLOSE_RES[m.group(1)])
     
-    for heading_match in headings:
+    for heading_match, heading_inner in headings:
         level = heading_match.group(1)
-        heading_content = heading_match.group(2).strip()
+        heading_content = heading_inner.strip()
         
         # Check if heading has JSX expressions (dynamic content) - these are acceptable
-        has_jsx_expression = re.search(r'{[^}]+}', heading_content)
+        has_jsx_expression = JSX_EXPRESSION_RE.search(heading_content)
         
         # Remove JSX expressions and tags to get text content
-        text_content = re.sub(r'{[^}]+}', '', heading_content)
-        text_content = re.sub(r'<[^>]+>', '', text_content).strip()
+        text_content = JSX_EXPRESSION_RE.sub('', heading_content)
+        text_content = TAG_RE.sub('', text_content).strip()
         
         # Check for empty headings (only if no JSX expressions)
         if not text_content and not has_jsx_expression:
-            line_num = content[:heading_match.start()].count('\n') + 1
-            issues.append(NavigableIssue(
-                file_path=str(file_path),
+            line_num = line_number(line_starts, heading_match.start())
+            yield NavigableIssue(
+                file_path=ctx.path,
                 line_num=line_num,
                 issue_type='headings_labels',
                 message=f'<h{level}> heading is empty or has no descriptive text',
                 sc='2.4.6'
-            ))
+            )
             continue
         
         # Check for placeholder text
-        placeholder_text = [
-            'heading',
-            'title',
-            'placeholder',
-            'todo',
-            'tbd',
-            'test',
-        ]
-        
-        if text_content.lower() in placeholder_text:
-            line_num = content[:heading_match.start()].count('\n') + 1
-            issues.append(NavigableIssue(
-                file_path=str(file_path),
+        if text_content.lower() in PLACEHOLDER_HEADINGS:
+            line_num = line_number(line_starts, heading_match.start())
+            yield NavigableIssue(
+                file_path=ctx.path,
                 line_num=line_num,
                 issue_type='headings_labels',
                 message=f'<h{level}> heading text "{text_content}" is not descriptive',
                 sc='2.4.6'
-            ))
+            )
     
     # Check for form labels
-    label_pattern = r'<label[^>]*>(.*?)</label>'
-    labels = re.finditer(label_pattern, content, re.DOTALL | re.IGNORECASE)
+    labels = iter_elements(content, LABEL_OPEN_RE, lambda _: LABEL_CLOSE_RE)
     
-    for label_match in labels:
-        label_content = label_match.group(1).strip()
+    for label_match, label_inner in labels:
+        label_content = label_inner.strip()
         
         # Check if label has JSX expressions (dynamic content) - these are acceptable
-        has_jsx_expression = re.search(r'{[^}]+}', label_content)
+        has_jsx_expression = JSX_EXPRESSION_RE.search(label_content)
         
         # Remove JSX and tags
-        text_content = re.sub(r'{[^}]+}', '', label_content)
-        text_content = re.sub(r'<[^>]+>', '', text_content).strip()
+        text_content = JSX_EXPRESSION_RE.sub('', label_content)
+        text_content = TAG_RE.sub('', text_content).strip()
         
         if not text_content and not has_jsx_expression:
-            line_num = content[:label_match.start()].count('\n') + 1
-            issues.append(NavigableIssue(
-                file_path=str(file_path),
+            line_num = line_number(line_starts, label_match.start())
+            yield NavigableIssue(
+                file_path=ctx.path,
                 line_num=line_num,
                 issue_type='headings_labels',
                 message='Form label is empty or has no descriptive text',
                 sc='2.4.6'
-            ))
-    
-    return issues
+            )
 
-def check_focus_visible(file_path: Path, lines: List[str]) -> List[NavigableIssue]:
+def check_focus_visible(ctx: FileContext, content: str, lines: List[str], line_starts: List[int]) -> Iterator[NavigableIssue]:
     """
     SC 2.4.7 Focus Visible (Level AA)
     
@@ -454,55 +563,62 @@ def check_focus_visible(file_path: Path, lines: List[str]) -> List[NavigableIssu
     - Focus indicators must have ≥3:1 contrast ratio (checked by contrast script)
     - We check for anti-patterns like outline: none without focus-visible
     """
-    issues = []
-    
     # Check for outline: none without focus-visible or alternative
-    for i, line in enumerate(lines, 1):
-        # Match outline: none or outline: 0
-        outline_none = re.search(r'outline\s*:\s*(none|0)', line, re.IGNORECASE)
+    # Match outline: none or outline: 0 in one pass over the content, once per line
+    last_line = 0
+    for outline_none in OUTLINE_NONE_RE.finditer(content):
+        i = line_number(line_starts, outline_none.start())
+        if i == last_line:
+            continue
+        last_line = i
+        line = lines[i - 1]
         
-        if outline_none:
-            # Check if this is in a focus-visible context (acceptable)
-            is_focus_visible = re.search(r'focus-visible:', line, re.IGNORECASE)
-            has_custom_focus = re.search(r'(ring|border|shadow|box-shadow)', line, re.IGNORECASE)
+        # Check if this is in a focus-visible context (acceptable)
+        is_focus_visible = FOCUS_VISIBLE_RE.search(line)
+        has_custom_focus = CUSTOM_FOCUS_RE.search(line)
+        
+        if not is_focus_visible and not has_custom_focus:
+            # Check if custom focus styles are defined nearby
+            context = line_context(content, line_starts, i - 3, i + 3)
             
-            if not is_focus_visible and not has_custom_focus:
-                # Check if custom focus styles are defined nearby
-                context_start = max(0, i - 3)
-                context_end = min(len(lines), i + 3)
-                context = ''.join(lines[context_start:context_end])
-                
-                has_focus_styles = re.search(r'(focus:|focus-visible:|focus-within:)', context, re.IGNORECASE)
-                
-                if not has_focus_styles:
-                    issues.append(NavigableIssue(
-                        file_path=str(file_path),
-                        line_num=i,
-                        issue_type='focus_visible',
-                        message='outline: none removes focus indicator. Provide alternative focus styles (ring, border, shadow)',
-                        sc='2.4.7'
-                    ))
-    
-    return issues
+            has_focus_styles = FOCUS_STYLES_RE.search(context)
+            
+            if not has_focus_styles:
+                yield NavigableIssue(
+                    file_path=ctx.path,
+                    line_num=i,
+                    issue_type='focus_visible',
+                    message='outline: none removes focus indicator. Provide alternative focus styles (ring, border, shadow)',
+                    sc='2.4.7'
+                )
+
+def iter_file_issues(ctx: FileContext, content: str) -> Iterator[NavigableIssue]:
+    """Yield the issues of all navigable criteria for one file's content"""
+    # Split once; the checks share the lines and their offsets into content
+    lines = content.split('\n')
+    line_starts = get_line_starts(lines)
+    
+    # Run all checks, skipping those whose trigger text isn't in the file
+    yield from check_bypass_blocks(ctx, content, lines, line_starts)
+    yield from check_page_titled(ctx, content, lines, line_starts)
+    if 'tabIndex' in content:
+        yield from check_focus_order(ctx, content, lines, line_starts)
+    if '<Link' in content:
+        yield from check_link_purpose(ctx, content, lines, line_starts)
+    if '<PageHeader' in content:
+        yield from check_multiple_ways(ctx, content, lines, line_starts)
+    if HEADINGS_LABELS_TRIGGER_RE.search(content):
+        yield from check_headings_labels(ctx, content, lines, line_starts)
+    if OUTLINE_TRIGGER_RE.search(content):
+        yield from check_focus_visible(ctx, content, lines, line_starts)
 
 def validate_file(file_path: Path) -> List[NavigableIssue]:
     """Validate a single file for all navigable criteria"""
-    lines = read_file_lines(file_path)
-    if not lines:
+    ctx = FileContext.from_path(file_path)
+    content = read_file(file_path, ctx)
+    if not content:
         return []
-    
-    issues = []
-    
-    # Run all checks
-    issues.extend(check_bypass_blocks(file_path, lines))
-    issues.extend(check_page_titled(file_path, lines))
-    issues.extend(check_focus_order(file_path, lines))
-    issues.extend(check_link_purpose(file_path, lines))
-    issues.extend(check_multiple_ways(file_path, lines))
-    issues.extend(check_headings_labels(file_path, lines))
-    issues.extend(check_focus_visible(file_path, lines))
-    
-    return issues
+    return list(iter_file_issues(ctx, content))
 
 def print_violations(issues: List[NavigableIssue], total_files: int) -> None:
     """Print validation results"""
@@ -520,10 +636,8 @@ def print_violations(issues: List[NavigableIssue], total_files: int) -> None:
         return
     
     # Group issues by success criterion
-    issues_by_sc: Dict[str, List[NavigableIssue]] = {}
+    issues_by_sc: Dict[str, List[NavigableIssue]] = defaultdict(list)
     for issue in issues:
-        if issue.sc not in issues_by_sc:
-            issues_by_sc[issue.sc] = []
         issues_by_sc[issue.sc].append(issue)
     
     print(f"❌ Navigable validation failed: {len(issues)} issues found in {total_files} files")
@@ -564,10 +678,11 @@ def main() -> int:
     print(f"Found {len(files)} files to validate")
     print()
     
+    # Files are independent, so validate them in parallel; map keeps results in file order
     all_issues = []
-    for file_path in files:
-        issues = validate_file(file_path)
-        all_issues.extend(issues)
+    with ProcessPoolExecutor() as executor:
+        for issues in executor.map(validate_file, files, chunksize=16):
+            all_issues.extend(issues)
     
     print_violations(all_issues, len(files))
     
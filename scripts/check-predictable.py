@@ -14,52 +14,248 @@ EN 301 549 Reference: Section 9.3.2 (Predictable)
 Exit codes:
 - 0: All checks pass (Level A/AA)
 - 1: One or more Level A/AA issues found
+
+Pass --skip-aaa to skip the informational Level AAA check (it never affects the exit code).
+
+Pass --cache to keep per-file results in .cache/check-predictable.json and reuse them while a
+file's modification time and size are unchanged.
 """
 
+import json
+import os
 import re
 import sys
+import tempfile
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Set, Tuple
+from dataclasses import astuple, dataclass
+from typing import Dict, List, Set, Tuple
 from collections import defaultdict
+from itertools import accumulate
+
+# File suffixes to check, searched for recursively from the working directory
+INCLUDE_SUFFIXES = ('.tsx', '.jsx', '.ts', '.js', '.mdx')
+
+# Per-file results of earlier runs, relative to the working directory
+CACHE_FILE = Path('.cache') / 'check-predictable.json'
+
+# Directory names that are never descended into
+EXCLUDE_DIRS = frozenset({
+    'node_modules', '.next', 'out', 'dist', 'build',
+    '.git', 'public', 'coverage', '__tests__'
+})
+
+# Precompiled patterns shared by the checks
+
+# Literal triggers of the line-based checks, found in one pass per file; each check's
+# patterns require its trigger text. The lookahead skips positions no trigger starts at
+TRIGGER_RE = re.compile(
+    r'(?=[ownrs<])'
+    r'(?:(?P<focus>onFocus)'
+    r'|(?P<input>onChange)'
+    r'|(?P<aaa>window\.location|router\.push|navigate\(|setTimeout|setInterval|<meta))',
+    re.IGNORECASE
+)
+
+# Trigger text of every check (TRIGGER_RE plus the custom <nav> of SC 3.2.3), probed on the raw
+# bytes so files without any are never decoded. Bytes IGNORECASE is ASCII-only, so the UTF-8 forms
+# of İ, ı and ſ, which str patterns fold to i and s, also count as a possible trigger
+CHECK_TRIGGER_BYTES_RE = re.compile(
+    rb'(?=[ownrs<])(?:onFocus|onChange|window\.location|router\.push|navigate\(|setTimeout|setInterval|<meta|<nav)'
+    rb'|\xc4[\xb0\xb1]|\xc5\xbf',
+    re.IGNORECASE
+)
+
+# SC 3.2.1: patterns that indicate context changes on focus
+FOCUS_PATTERNS = [
+    (re.compile(r'onFocus\s*=\s*\{[^}]*(?:window\.location|router\.push|navigate\()', re.IGNORECASE),
+     'onFocus triggers navigation'),
+    (re.compile(r'onFocus\s*=\s*\{[^}]*(?:window\.open|\.submit\(\))', re.IGNORECASE),
+     'onFocus triggers form submission or new window'),
+    (re.compile(r'onFocus\s*=\s*\{[^}]*(?:\.click\(\)|\.focus\(\))', re.IGNORECASE),
+     'onFocus triggers other element interaction'),
+]
+
+# SC 3.2.2: patterns that indicate context changes on input
+INPUT_PATTERNS = [
+    (re.compile(r'onChange\s*=\s*\{[^}]*(?:window\.location|router\.push|navigate\()', re.IGNORECASE),
+     'onChange triggers navigation'),
+    (re.compile(r'onChange\s*=\s*\{[^}]*(?:\.submit\(\)|handleSubmit)', re.IGNORECASE),
+     'onChange auto-submits form'),
+    (re.compile(r'<select[^>]*onChange\s*=\s*\{[^}]*(?:submit|navigate|push)', re.IGNORECASE),
+     'Select onChange triggers form submission or navigation'),
+]
+AUTO_SUBMIT_WARNING_RE = re.compile(
+    r'(?:will\s+automatically|auto[\s-]?submit|automatically\s+submit|form\s+will\s+submit)',
+    re.IGNORECASE
+)
+LOCAL_AUTO_SUBMIT_WARNING_RE = re.compile(
+    r'(?:will\s+automatically|auto[\s-]?submit|automatically\s+submit)',
+    re.IGNORECASE
+)
+
+# SC 3.2.3: navigation structure
+NAV_ELEMENT_RE = re.compile(r'<(?:nav|Navigation)', re.IGNORECASE)
+NAV_LINK_RE = re.compile(
+    r'<Link[^>]*(?:href=["\'](.*?)["\'])[^>]*>([^<]*)</Link>|<Link[^>]*aria-label=["\'](.*?)["\']',
+    re.DOTALL
+)
+LAYOUT_RE = re.compile(r'<Layout')
+NAVIGATION_COMPONENT_RE = re.compile(r'<Navigation')
+CUSTOM_NAV_RE = re.compile(r'<nav[^>]*>', re.IGNORECASE)
 
-@dataclass
+# SC 3.2.4: interactive component patterns
+BUTTON_RE = re.compile(
+    r'<(?:Button|button)[^>]*(?:aria-label=["\'](.*?)["\'])?[^>]*>(.*?)</(?:Button|button)>',
+    re.DOTALL | re.IGNORECASE
+)
+LINK_RE = re.compile(
+    r'<Link[^>]*href=["\'](.*?)["\'][^>]*(?:aria-label=["\'](.*?)["\'])?[^>]*>(.*?)</Link>',
+    re.DOTALL | re.IGNORECASE
+)
+ICON_NAME_RE = re.compile(r'<(\w+Icon)')
+CHILD_TEXT_RE = re.compile(r'>([A-Za-z\s]+)<')
+
+# SC 3.2.5 (Level AAA): informational patterns
+AAA_PATTERNS = [
+    (re.compile(r'(?:window\.location|router\.push|navigate\()[^)]*\)\s*(?://|/\*)?(?!.*user)', re.IGNORECASE),
+     'Automatic navigation without explicit user action'),
+    (re.compile(r'setTimeout\s*\([^)]*(?:location|push|navigate)', re.IGNORECASE),
+     'Delayed automatic navigation'),
+    (re.compile(r'setInterval\s*\([^)]*(?:location|reload)', re.IGNORECASE),
+     'Automatic page reload'),
+    (re.compile(r'<meta[^>]*http-equiv=["\']\s*refresh', re.IGNORECASE),
+     'Meta refresh tag (automatic redirect)'),
+]
+
+@dataclass(frozen=True, slots=True)
 class PredictableIssue:
     """Represents a predictable guideline violation"""
-    file_path: Path
+    file_path: str
     line_number: int
     criterion: str
     level: str
     message: str
     code_snippet: str
 
-def read_file_lines(file_path: Path) -> List[str]:
-    """Read file and return lines, handling encoding errors"""
+@dataclass(frozen=True, slots=True)
+class FileContext:
+    """A file's content and path classification, read and indexed once and shared by all checks"""
+    path: str
+    is_page: bool
+    content: str
+    lines: List[str]
+    line_starts: List[int]
+    trigger_lines: Dict[str, List[int]]
+
+def read_file(file_path: Path) -> str:
+    """Read file and return its content, handling encoding errors
+    
+    Returns '' without decoding when no check's trigger text is present
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.readlines()
+        data = file_path.read_bytes()
+        if not CHECK_TRIGGER_BYTES_RE.search(data):
+            return ''
+        content = data.decode('utf-8')
     except (UnicodeDecodeError, FileNotFoundError):
-        return []
+        return ''
+    
+    # Match text-mode reads, which translate \r\n and \r to \n
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+def get_line_starts(lines: List[str]) -> List[int]:
+    """Offset of the first character of each line, plus a sentinel one past the end of the content"""
+    return [0, *accumulate(len(line) + 1 for line in lines)]
+
+def line_number(line_starts: List[int], offset: int) -> int:
+    """1-based line number of a character offset in the content"""
+    return bisect_right(line_starts, offset)
+
+def line_context(content: str, line_starts: List[int], start: int, end: int) -> str:
+    """Return lines[start:end] joined by newlines, sliced directly from the file content"""
+    start = max(0, start)
+    end = min(len(line_starts) - 1, end)
+    return content[line_starts[start]:line_starts[end] - 1]
+
+def load_cache(signature: Tuple) -> Dict[str, Tuple[int, int, List[PredictableIssue]]]:
+    """Load cached per-file results, or nothing if they were written under another signature"""
+    try:
+        with open(CACHE_FILE, encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['signature'] != list(signature):
+            return {}
+        return {
+            path: (mtime_ns, size, [PredictableIssue(*fields) for fields in issues])
+            for path, (mtime_ns, size, issues) in cached['files'].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # Missing, unreadable or malformed: every file is validated afresh
+        return {}
+
+def save_cache(signature: Tuple, entries: Dict[str, Tuple[int, int, List[PredictableIssue]]]):
+    """Write per-file results for the next run; failing to cache is not an error"""
+    temp_name = None
+    try:
+        CACHE_FILE.parent.mkdir(exist_ok=True)
+        # A unique temporary name, so concurrent runs never write into each other's file
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=CACHE_FILE.parent,
+                                         suffix='.tmp', delete=False) as f:
+            temp_name = f.name
+            json.dump({
+                'signature': signature,
+                'files': {
+                    path: (mtime_ns, size, [astuple(issue) for issue in issues])
+                    for path, (mtime_ns, size, issues) in entries.items()
+                },
+            }, f)
+        os.replace(temp_name, CACHE_FILE)
+    except OSError:
+        if temp_name is not None:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
 
 def get_file_list() -> List[Path]:
     """Get list of files to check (TSX, JSX, TS, JS, MDX)"""
-    root = Path('.')
-    patterns = ['**/*.tsx', '**/*.jsx', '**/*.ts', '**/*.js', '**/*.mdx']
-    
-    exclude_dirs = {
-        'node_modules', '.next', 'out', 'dist', 'build', 
-        '.git', 'public', 'coverage', '__tests__'
-    }
-    
+    # One os.scandir walk for all suffixes; excluded directories are pruned without being scanned
     files = []
-    for pattern in patterns:
-        for file_path in root.glob(pattern):
-            if not any(excluded in file_path.parts for excluded in exclude_dirs):
-                files.append(file_path)
+    pending = ['.']
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like Path.glob('**'), don't follow directory symlinks
+                        if entry.name not in EXCLUDE_DIRS and not entry.is_symlink():
+                            pending.append(entry.path)
+                    elif entry.name.endswith(INCLUDE_SUFFIXES):
+                        files.append(Path(entry.path))
+        except FileNotFoundError:
+            continue
+    
+    return sorted(files)
+
+def find_trigger_lines(content: str, line_starts: List[int]) -> Dict[str, List[int]]:
+    """Map each TRIGGER_RE group to the 1-based numbers of the lines it fires on
     
-    return sorted(set(files))
+    The triggers never span a newline, so one scan over the whole content finds
+    the same matches as a scan of each line
+    """
+    trigger_lines = {group: [] for group in TRIGGER_RE.groupindex}
+    for match in TRIGGER_RE.finditer(content):
+        i = line_number(line_starts, match.start())
+        group_lines = trigger_lines[match.lastgroup]
+        if not group_lines or group_lines[-1] != i:
+            group_lines.append(i)
+    return trigger_lines
 
-def check_on_focus(file_path: Path, lines: List[str]) -> List[PredictableIssue]:
+def check_on_focus(ctx: FileContext) -> List[PredictableIssue]:
     """
     SC 3.2.1 On Focus (Level A)
     
@@ -73,21 +269,12 @@ def check_on_focus(file_path: Path, lines: List[str]) -> List[PredictableIssue]:
     """
     issues = []
     
-    # Patterns that indicate context changes on focus
-    dangerous_focus_patterns = [
-        (r'onFocus\s*=\s*\{[^}]*(?:window\.location|router\.push|navigate\()', 
-         'onFocus triggers navigation'),
-        (r'onFocus\s*=\s*\{[^}]*(?:window\.open|\.submit\(\))', 
-         'onFocus triggers form submission or new window'),
-        (r'onFocus\s*=\s*\{[^}]*(?:\.click\(\)|\.focus\(\))', 
-         'onFocus triggers other element interaction'),
-    ]
-    
-    for i, line in enumerate(lines, 1):
-        for pattern, description in dangerous_focus_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
+    for i in ctx.trigger_lines['focus']:
+        line = ctx.lines[i - 1]
+        for pattern, description in FOCUS_PATTERNS:
+            if pattern.search(line):
                 issues.append(PredictableIssue(
-                    file_path=file_path,
+                    file_path=ctx.path,
                     line_number=i,
                     criterion='SC 3.2.1',
                     level='A',
@@ -97,7 +284,7 @@ def check_on_focus(file_path: Path, lines: List[str]) -> List[PredictableIssue]:
     
     return issues
 
-def check_on_input(file_path: Path, lines: List[str]) -> List[PredictableIssue]:
+def check_on_input(ctx: FileContext) -> List[PredictableIssue]:
     """
     SC 3.2.2 On Input (Level A)
     
@@ -113,40 +300,22 @@ def check_on_input(file_path: Path, lines: List[str]) -> List[PredictableIssue]:
     issues = []
     
     # Track if there are warnings/labels about auto-submit behavior
-    content = ''.join(lines)
-    has_auto_submit_warning = bool(re.search(
-        r'(?:will\s+automatically|auto[\s-]?submit|automatically\s+submit|form\s+will\s+submit)',
-        content,
-        re.IGNORECASE
-    ))
-    
-    # Patterns that indicate context changes on input
-    dangerous_input_patterns = [
-        (r'onChange\s*=\s*\{[^}]*(?:window\.location|router\.push|navigate\()', 
-         'onChange triggers navigation'),
-        (r'onChange\s*=\s*\{[^}]*(?:\.submit\(\)|handleSubmit)', 
-         'onChange auto-submits form'),
-        (r'<select[^>]*onChange\s*=\s*\{[^}]*(?:submit|navigate|push)', 
-         'Select onChange triggers form submission or navigation'),
-    ]
-    
-    for i, line in enumerate(lines, 1):
-        for pattern, description in dangerous_input_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
+    # A file-wide warning covers every onChange in the file
+    if AUTO_SUBMIT_WARNING_RE.search(ctx.content):
+        return issues
+    
+    for i in ctx.trigger_lines['input']:
+        line = ctx.lines[i - 1]
+        for pattern, description in INPUT_PATTERNS:
+            if pattern.search(line):
                 # Check if this is in a context with warnings
-                context_start = max(0, i - 10)
-                context_lines = lines[context_start:i+5]
-                context = ''.join(context_lines)
+                context = line_context(ctx.content, ctx.line_starts, i - 10, i + 5)
                 
-                has_local_warning = bool(re.search(
-                    r'(?:will\s+automatically|auto[\s-]?submit|automatically\s+submit)',
-                    context,
-                    re.IGNORECASE
-                ))
+                has_local_warning = bool(LOCAL_AUTO_SUBMIT_WARNING_RE.search(context))
                 
-                if not (has_auto_submit_warning or has_local_warning):
+                if not has_local_warning:
                     issues.append(PredictableIssue(
-                        file_path=file_path,
+                        file_path=ctx.path,
                         line_number=i,
                         criterion='SC 3.2.2',
                         level='A',
@@ -156,7 +325,7 @@ def check_on_input(file_path: Path, lines: List[str]) -> List[PredictableIssue]:
     
     return issues
 
-def extract_navigation_structure(file_path: Path, lines: List[str]) -> Set[str]:
+def extract_navigation_structure(ctx: FileContext) -> Set[str]:
     """
     Extract navigation link text and structure from a file.
     Returns set of navigation items (link text or aria-label).
@@ -164,17 +333,13 @@ def extract_navigation_structure(file_path: Path, lines: List[str]) -> Set[str]:
     nav_items = set()
     
     # Check if this file contains navigation structure
-    content = ''.join(lines)
-    
     # Look for Navigation component or nav elements
-    if not re.search(r'<(?:nav|Navigation)', content, re.IGNORECASE):
+    if not NAV_ELEMENT_RE.search(ctx.content):
         return nav_items
     
     # Extract Link components within navigation
     # Match: <Link href="...">Text</Link> or <Link aria-label="..." />
-    link_pattern = r'<Link[^>]*(?:href=["\'](.*?)["\'])[^>]*>([^<]*)</Link>|<Link[^>]*aria-label=["\'](.*?)["\']'
-    
-    for match in re.finditer(link_pattern, content, re.DOTALL):
+    for match in NAV_LINK_RE.finditer(ctx.content):
         href = match.group(1) or ''
         text = match.group(2) or match.group(3) or ''
         text = text.strip()
@@ -187,7 +352,7 @@ def extract_navigation_structure(file_path: Path, lines: List[str]) -> Set[str]:
     
     return nav_items
 
-def check_consistent_navigation(file_path: Path, lines: List[str]) -> List[PredictableIssue]:
+def check_consistent_navigation(ctx: FileContext) -> List[PredictableIssue]:
     """
     SC 3.2.3 Consistent Navigation (Level AA)
     
@@ -204,24 +369,18 @@ def check_consistent_navigation(file_path: Path, lines: List[str]) -> List[Predi
     # 1. Pages use consistent Navigation component (not ad-hoc navigation)
     # 2. No hardcoded navigation menus with different orders
     
-    content = ''.join(lines)
-    
     # Check if this is a page file
-    is_page = str(file_path).startswith('pages/') and not str(file_path).endswith('_app.tsx')
-    
-    if is_page:
+    if ctx.is_page:
         # Pages should use consistent Navigation component from Layout
-        has_layout = bool(re.search(r'<Layout', content))
-        has_navigation_component = bool(re.search(r'<Navigation', content))
-        has_custom_nav = bool(re.search(r'<nav[^>]*>', content, re.IGNORECASE))
+        has_custom_nav = bool(CUSTOM_NAV_RE.search(ctx.content))
         
         # If page has custom nav instead of Layout/Navigation, flag it
-        if has_custom_nav and not (has_layout or has_navigation_component):
+        if has_custom_nav and not (LAYOUT_RE.search(ctx.content) or NAVIGATION_COMPONENT_RE.search(ctx.content)):
             # Find the line with custom nav
-            for i, line in enumerate(lines, 1):
-                if re.search(r'<nav[^>]*>', line, re.IGNORECASE):
+            for i, line in enumerate(ctx.lines, 1):
+                if CUSTOM_NAV_RE.search(line):
                     issues.append(PredictableIssue(
-                        file_path=file_path,
+                        file_path=ctx.path,
                         line_number=i,
                         criterion='SC 3.2.3',
                         level='AA',
@@ -232,56 +391,51 @@ def check_consistent_navigation(file_path: Path, lines: List[str]) -> List[Predi
     
     return issues
 
-def extract_component_patterns(file_path: Path, lines: List[str]) -> List[Tuple[str, str, int]]:
+def extract_component_patterns(ctx: FileContext) -> List[Tuple[str, str, int]]:
     """
     Extract interactive component patterns with their labels/icons.
     Returns list of (component_type, identifier, line_number).
     """
     patterns = []
-    content = ''.join(lines)
     
     # Extract button patterns with icons/labels
     # Match: <Button><Icon />Text</Button> or <button aria-label="...">
-    button_pattern = r'<(?:Button|button)[^>]*(?:aria-label=["\'](.*?)["\'])?[^>]*>(.*?)</(?:Button|button)>'
-    
-    for match in re.finditer(button_pattern, content, re.DOTALL | re.IGNORECASE):
+    for match in BUTTON_RE.finditer(ctx.content):
         aria_label = match.group(1) or ''
         children = match.group(2) or ''
         
         # Extract icon component names
-        icon_match = re.search(r'<(\w+Icon)', children)
+        icon_match = ICON_NAME_RE.search(children)
         icon_name = icon_match.group(1) if icon_match else ''
         
         # Extract text content (non-JSX)
-        text_match = re.search(r'>([A-Za-z\s]+)<', children)
+        text_match = CHILD_TEXT_RE.search(children)
         text = text_match.group(1).strip() if text_match else ''
         
         identifier = aria_label or text or icon_name
         if identifier:
             # Find line number
-            line_num = content[:match.start()].count('\n') + 1
+            line_num = line_number(ctx.line_starts, match.start())
             patterns.append(('button', identifier, line_num))
     
     # Extract link patterns
-    link_pattern = r'<Link[^>]*href=["\'](.*?)["\'][^>]*(?:aria-label=["\'](.*?)["\'])?[^>]*>(.*?)</Link>'
-    
-    for match in re.finditer(link_pattern, content, re.DOTALL | re.IGNORECASE):
+    for match in LINK_RE.finditer(ctx.content):
         href = match.group(1) or ''
         aria_label = match.group(2) or ''
         children = match.group(3) or ''
         
         # Extract text content
-        text_match = re.search(r'>([A-Za-z\s]+)<', children)
+        text_match = CHILD_TEXT_RE.search(children)
         text = text_match.group(1).strip() if text_match else ''
         
         identifier = f"{href}|{aria_label or text}"
         if identifier:
-            line_num = content[:match.start()].count('\n') + 1
+            line_num = line_number(ctx.line_starts, match.start())
             patterns.append(('link', identifier, line_num))
     
     return patterns
 
-def check_consistent_identification(file_path: Path, lines: List[str]) -> List[PredictableIssue]:
+def check_consistent_identification(ctx: FileContext) -> List[PredictableIssue]:
     """
     SC 3.2.4 Consistent Identification (Level AA)
     
@@ -298,23 +452,12 @@ def check_consistent_identification(file_path: Path, lines: List[str]) -> List[P
     # This is primarily a manual check
     # We can provide informational guidance for common patterns
     
-    content = ''.join(lines)
-    
-    # Check for inconsistent button labels for common actions
-    common_actions = {
-        'submit': ['submit', 'send', 'submit form', 'send message'],
-        'cancel': ['cancel', 'close', 'dismiss'],
-        'delete': ['delete', 'remove', 'trash'],
-        'edit': ['edit', 'modify', 'update'],
-        'save': ['save', 'save changes', 'apply'],
-    }
-    
     # This check is informational only - actual consistency requires cross-file analysis
     # We'll just ensure buttons have clear, consistent naming patterns
     
     return issues
 
-def check_change_on_request(file_path: Path, lines: List[str]) -> List[PredictableIssue]:
+def check_change_on_request(ctx: FileContext) -> List[PredictableIssue]:
     """
     SC 3.2.5 Change on Request (Level AAA)
     
@@ -331,22 +474,12 @@ def check_change_on_request(file_path: Path, lines: List[str]) -> List[Predictab
     issues = []
     
     # Level AAA - informational warnings only
-    aaa_patterns = [
-        (r'(?:window\.location|router\.push|navigate\()[^)]*\)\s*(?://|/\*)?(?!.*user)', 
-         'Automatic navigation without explicit user action'),
-        (r'setTimeout\s*\([^)]*(?:location|push|navigate)', 
-         'Delayed automatic navigation'),
-        (r'setInterval\s*\([^)]*(?:location|reload)', 
-         'Automatic page reload'),
-        (r'<meta[^>]*http-equiv=["\']\s*refresh', 
-         'Meta refresh tag (automatic redirect)'),
-    ]
-    
-    for i, line in enumerate(lines, 1):
-        for pattern, description in aaa_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
+    for i in ctx.trigger_lines['aaa']:
+        line = ctx.lines[i - 1]
+        for pattern, description in AAA_PATTERNS:
+            if pattern.search(line):
                 issues.append(PredictableIssue(
-                    file_path=file_path,
+                    file_path=ctx.path,
                     line_number=i,
                     criterion='SC 3.2.5',
                     level='AAA',
@@ -356,25 +489,43 @@ def check_change_on_request(file_path: Path, lines: List[str]) -> List[Predictab
     
     return issues
 
-def validate_file(file_path: Path) -> List[PredictableIssue]:
-    """Validate a single file for all predictable criteria"""
-    lines = read_file_lines(file_path)
-    if not lines:
+def validate_file(file_path: Path, include_aaa: bool = True) -> List[PredictableIssue]:
+    """Validate a single file for all predictable criteria (Level AAA only if include_aaa)"""
+    content = read_file(file_path)
+    if not content:
         return []
     
+    # Split once; the checks share the lines and their offsets into content,
+    # and one pass over the content finds where each line-based check can fire
+    lines = content.split('\n')
+    line_starts = get_line_starts(lines)
+    path = str(file_path)
+    ctx = FileContext(
+        path=path,
+        is_page=path.startswith('pages/') and not path.endswith('_app.tsx'),
+        content=content,
+        lines=lines,
+        line_starts=line_starts,
+        trigger_lines=find_trigger_lines(content, line_starts),
+    )
     issues = []
     
-    # Run all checks
-    issues.extend(check_on_focus(file_path, lines))
-    issues.extend(check_on_input(file_path, lines))
-    issues.extend(check_consistent_navigation(file_path, lines))
-    issues.extend(check_consistent_identification(file_path, lines))
-    issues.extend(check_change_on_request(file_path, lines))
+    # Run all checks, skipping the line-based ones when their trigger text is absent
+    if ctx.trigger_lines['focus']:
+        issues.extend(check_on_focus(ctx))
+    if ctx.trigger_lines['input']:
+        issues.extend(check_on_input(ctx))
+    issues.extend(check_consistent_navigation(ctx))
+    issues.extend(check_consistent_identification(ctx))
+    if include_aaa and ctx.trigger_lines['aaa']:
+        issues.extend(check_change_on_request(ctx))
     
     return issues
 
-def print_report(all_issues: List[PredictableIssue], total_files: int):
+def print_report(all_issues: List[PredictableIssue], total_files: int, include_aaa: bool = True):
     """Print formatted validation report"""
+    # Build the report and write it at once rather than a print() per line
+    output = []
     
     # Separate Level A/AA errors from Level AAA informational
     errors = [issue for issue in all_issues if issue.level in ['A', 'AA']]
@@ -385,9 +536,9 @@ def print_report(all_issues: List[PredictableIssue], total_files: int):
     for issue in all_issues:
         by_criterion[issue.criterion].append(issue)
     
-    print("\n" + "="*80)
-    print("WCAG 2.1 Guideline 3.2 - Predictable Validation Report")
-    print("="*80)
+    output.append("\n" + "="*80)
+    output.append("WCAG 2.1 Guideline 3.2 - Predictable Validation Report")
+    output.append("="*80)
     
     criterion_names = {
         'SC 3.2.1': 'On Focus (Level A)',
@@ -398,9 +549,9 @@ def print_report(all_issues: List[PredictableIssue], total_files: int):
     }
     
     # Print summary
-    print(f"\nFiles checked: {total_files}")
-    print(f"Total issues: {len(all_issues)} ({len(errors)} errors, {len(warnings)} warnings)")
-    print("\nSuccess Criteria Status:")
+    output.append(f"\nFiles checked: {total_files}")
+    output.append(f"Total issues: {len(all_issues)} ({len(errors)} errors, {len(warnings)} warnings)")
+    output.append("\nSuccess Criteria Status:")
     
     for criterion in ['SC 3.2.1', 'SC 3.2.2', 'SC 3.2.3', 'SC 3.2.4', 'SC 3.2.5']:
         criterion_issues = by_criterion.get(criterion, [])
@@ -408,31 +559,33 @@ def print_report(all_issues: List[PredictableIssue], total_files: int):
         criterion_warnings = [i for i in criterion_issues if i.level == 'AAA']
         
         status = "✓ PASS" if len(criterion_errors) == 0 else f"✗ FAIL ({len(criterion_errors)} issues)"
+        if criterion == 'SC 3.2.5' and not include_aaa:
+            status = "- SKIPPED (--skip-aaa)"
         warning_note = f" [{len(criterion_warnings)} AAA warnings]" if criterion_warnings else ""
-        print(f"  {criterion} - {criterion_names[criterion]}: {status}{warning_note}")
+        output.append(f"  {criterion} - {criterion_names[criterion]}: {status}{warning_note}")
     
     # Print detailed issues
     if all_issues:
-        print("\n" + "-"*80)
-        print("ISSUES FOUND:")
-        print("-"*80)
+        output.append("\n" + "-"*80)
+        output.append("ISSUES FOUND:")
+        output.append("-"*80)
         
         for criterion in sorted(by_criterion.keys()):
             issues = by_criterion[criterion]
-            print(f"\n{criterion} - {criterion_names.get(criterion, criterion)} ({len(issues)} issues):")
+            output.append(f"\n{criterion} - {criterion_names.get(criterion, criterion)} ({len(issues)} issues):")
             
-            for issue in sorted(issues, key=lambda x: (str(x.file_path), x.line_number)):
+            for issue in sorted(issues, key=lambda x: (x.file_path, x.line_number)):
                 level_marker = "ERROR" if issue.level in ['A', 'AA'] else "INFO"
-                print(f"\n  [{level_marker}] {issue.file_path}:{issue.line_number}")
-                print(f"  {issue.message}")
+                output.append(f"\n  [{level_marker}] {issue.file_path}:{issue.line_number}")
+                output.append(f"  {issue.message}")
                 if issue.code_snippet:
-                    print(f"  Code: {issue.code_snippet[:100]}")
+                    output.append(f"  Code: {issue.code_snippet[:100]}")
     
     # Print guidance
-    print("\n" + "="*80)
-    print("IMPLEMENTATION GUIDANCE:")
-    print("="*80)
-    print("""
+    output.append("\n" + "="*80)
+    output.append("IMPLEMENTATION GUIDANCE:")
+    output.append("="*80)
+    output.append("""
 SC 3.2.1 On Focus (Level A):
   - Focus events MUST NOT trigger navigation, form submission, or new windows
   - Use onFocus only for visual feedback (styling, hints)
@@ -464,33 +617,69 @@ SC 3.2.5 Change on Request (Level AAA - Best Practice):
 """)
     
     # EN 301 549 compliance note
-    print("="*80)
-    print("EN 301 549 COMPLIANCE:")
-    print("="*80)
+    output.append("="*80)
+    output.append("EN 301 549 COMPLIANCE:")
+    output.append("="*80)
     if len(errors) == 0:
-        print("✓ Section 9.3.2 (Predictable): COMPLIANT")
-        print("  All Level A and AA requirements met")
+        output.append("✓ Section 9.3.2 (Predictable): COMPLIANT")
+        output.append("  All Level A and AA requirements met")
     else:
-        print("✗ Section 9.3.2 (Predictable): NON-COMPLIANT")
-        print(f"  {len(errors)} Level A/AA issues must be resolved")
+        output.append("✗ Section 9.3.2 (Predictable): NON-COMPLIANT")
+        output.append(f"  {len(errors)} Level A/AA issues must be resolved")
     
     if warnings:
-        print(f"\nℹ {len(warnings)} Level AAA recommendations for enhanced predictability")
+        output.append(f"\nℹ {len(warnings)} Level AAA recommendations for enhanced predictability")
     
-    print("="*80 + "\n")
+    output.append("="*80 + "\n")
+    
+    sys.stdout.write('\n'.join(output) + '\n')
 
 def main():
     """Main validation entry point"""
     print("Checking WCAG 2.1 Guideline 3.2 (Predictable)...")
     
+    include_aaa = '--skip-aaa' not in sys.argv[1:]
+    use_cache = '--cache' in sys.argv[1:]
+    validate = partial(validate_file, include_aaa=include_aaa)
     files = get_file_list()
-    all_issues = []
-    
-    for file_path in files:
-        issues = validate_file(file_path)
-        all_issues.extend(issues)
     
-    print_report(all_issues, len(files))
+    # Reuse cached results of files whose modification time and size are unchanged; the
+    # signature drops the whole cache when this script or the AAA setting changes
+    script_stat = os.stat(__file__)
+    signature = (script_stat.st_mtime_ns, script_stat.st_size, include_aaa)
+    cache = load_cache(signature) if use_cache else {}
+    file_stats = []
+    results = []
+    stale = []
+    for index, file_path in enumerate(files):
+        try:
+            file_stat = os.stat(file_path)
+            stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+        except OSError:
+            stamp = None
+        file_stats.append(stamp)
+        cached = cache.get(str(file_path))
+        if stamp is not None and cached is not None and cached[:2] == stamp:
+            results.append(cached[2])
+        else:
+            results.append(None)
+            stale.append(index)
+    
+    # Files are independent, so validate them in parallel; map keeps results in file order
+    with ProcessPoolExecutor() as executor:
+        stale_files = [files[index] for index in stale]
+        for index, issues in zip(stale, executor.map(validate, stale_files, chunksize=16)):
+            results[index] = issues
+    
+    if use_cache:
+        save_cache(signature, {
+            str(file_path): (*stamp, issues)
+            for file_path, stamp, issues in zip(files, file_stats, results)
+            if stamp is not None
+        })
+    
+    all_issues = [issue for issues in results for issue in issues]
+    print_report(all_issues, len(files), include_aaa)
     
     # Exit with error if Level A/AA issues found
     errors = [issue for issue in all_issues if issue.level in ['A', 'AA']]
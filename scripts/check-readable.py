@@ -20,6 +20,8 @@ Usage:
 import os
 import sys
 import re
+from bisect import bisect_right
+from itertools import accumulate
 from pathlib import Path
 from typing import List, Dict, Tuple, Set
 
@@ -30,11 +32,18 @@ INCLUDE_PATTERNS = [
     'components/**/*.tsx',
 ]
 
-# Files to exclude from validation
-EXCLUDE_FILES = {
+# Directories (relative to the project root) excluded from validation
+EXCLUDE_DIRS = {
     'pages/api',
 }
 
+# Precompiled patterns for SC 3.1.1 Language of Page
+HTML_ELEMENT_RE = re.compile(r'<[Hh]tml\s')
+# The opening <Html ...> tag; the optional lookahead captures the first lang="..."
+# within its attributes, so one search finds both the element and its language
+HTML_TAG_RE = re.compile(r'<[Hh]tml\s+(?=(?:[^>]*?lang\s*=\s*["\'](?P<lang>[^"\'>]+)["\'])?)[^>]*>')
+BCP47_RE = re.compile(r'[a-z]{2}(?:-[A-Z]{2})?')
+
 class ReadableIssue:
     """Represents a readable accessibility issue"""
     def __init__(self, file_path: str, line_num: int, issue_type: str, message: str, sc: str):
@@ -55,29 +64,52 @@ class ReadableIssue:
 
 def scan_files(root_dir: Path) -> List[Path]:
     """Scan for TypeScript/TSX files to validate"""
-    files = []
+    # INCLUDE_PATTERNS are all '<dir>/**/*<suffix>': walk each top-level
+    # directory once with os.scandir and match the suffixes directly
+    suffixes_by_dir: Dict[str, Tuple[str, ...]] = {}
     for pattern in INCLUDE_PATTERNS:
-        files.extend(root_dir.glob(pattern))
-    
-    # Filter out excluded files
-    filtered_files = []
-    for file_path in files:
-        relative_path = str(file_path.relative_to(root_dir))
-        if not any(excluded in relative_path for excluded in EXCLUDE_FILES):
-            filtered_files.append(file_path)
+        top_dir, _, file_glob = pattern.partition('/**/')
+        suffixes_by_dir[top_dir] = suffixes_by_dir.get(top_dir, ()) + (file_glob.lstrip('*'),)
     
-    return sorted(filtered_files)
+    files = []
+    for top_dir, suffixes in suffixes_by_dir.items():
+        top_path = os.path.join(root_dir, top_dir)
+        # Offset of top_dir within each entry path, for root-relative directory paths
+        relative_start = len(top_path) - len(top_dir)
+        pending = [top_path]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            # Like Path.glob('**'), don't follow directory symlinks;
+                            # excluded directories are pruned without being scanned
+                            if not entry.is_symlink() and entry.path[relative_start:] not in EXCLUDE_DIRS:
+                                pending.append(entry.path)
+                        elif entry.name.endswith(suffixes):
+                            files.append(Path(entry.path))
+            except FileNotFoundError:
+                continue
+    
+    return sorted(files)
 
-def read_file_lines(file_path: Path) -> List[str]:
-    """Read file and return lines"""
+def read_file(file_path: Path) -> str:
+    """Read file and return its content"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.readlines()
+        return file_path.read_text(encoding='utf-8')
     except Exception as e:
         print(f"Error reading {file_path}: {e}", file=sys.stderr)
-        return []
+        return ''
 
-def check_language_of_page(file_path: Path, lines: List[str]) -> List[ReadableIssue]:
+def get_line_starts(lines: List[str]) -> List[int]:
+    """Offset of the first character of each line, plus a sentinel one past the end of the content"""
+    return [0, *accumulate(len(line) + 1 for line in lines)]
+
+def line_number(line_starts: List[int], offset: int) -> int:
+    """1-based line number of a character offset in the content"""
+    return bisect_right(line_starts, offset)
+
+def check_language_of_page(file_path: Path, content: str) -> List[ReadableIssue]:
     """
     SC 3.1.1 Language of Page (Level A)
     
@@ -87,61 +119,52 @@ def check_language_of_page(file_path: Path, lines: List[str]) -> List[ReadableIs
     
     Notes:
     - This is a site-level requirement
-    - Only check _document.tsx file
+    - Only called for the _document.tsx file
     - Screen readers use lang to select pronunciation rules
     """
     issues = []
     
-    # Only check _document.tsx
-    if '_document.tsx' not in str(file_path):
-        return issues
+    # Find the <Html> or <html> element and its lang attribute in a single scan
+    html_match = HTML_TAG_RE.search(content)
     
-    content = ''.join(lines)
+    if not html_match:
+        # An unterminated <Html tag still counts as an Html element
+        if not HTML_ELEMENT_RE.search(content):
+            issues.append(ReadableIssue(
+                file_path=str(file_path),
+                line_num=1,
+                issue_type='language_of_page',
+                message='_document.tsx should use <Html> component from next/document',
+                sc='3.1.1'
+            ))
+        return issues
     
-    # Check for <Html> or <html> element with lang attribute
-    has_html_element = re.search(r'<[Hh]tml\s', content)
+    # Check if Html element has lang attribute
+    lang_value = html_match.group('lang')
+    line_num = line_number(get_line_starts(content.split('\n')), html_match.start())
     
-    if not has_html_element:
+    if not lang_value:
         issues.append(ReadableIssue(
             file_path=str(file_path),
-            line_num=1,
+            line_num=line_num,
             issue_type='language_of_page',
-            message='_document.tsx should use <Html> component from next/document',
+            message='<Html> element must have lang attribute (e.g., lang="en")',
             sc='3.1.1'
         ))
-        return issues
-    
-    # Check if Html element has lang attribute
-    html_match = re.search(r'<[Hh]tml\s+([^>]*?)>', content)
-    if html_match:
-        html_attrs = html_match.group(1)
-        has_lang = re.search(r'lang\s*=\s*["\']([^"\']+)["\']', html_attrs)
-        
-        if not has_lang:
-            line_num = content[:html_match.start()].count('\n') + 1
+    else:
+        # Validate lang value format (should be valid BCP 47 language tag)
+        if not BCP47_RE.fullmatch(lang_value):
             issues.append(ReadableIssue(
                 file_path=str(file_path),
                 line_num=line_num,
                 issue_type='language_of_page',
-                message='<Html> element must have lang attribute (e.g., lang="en")',
+                message=f'lang attribute "{lang_value}" should be valid BCP 47 code (e.g., "en", "en-US", "de", "fr")',
                 sc='3.1.1'
             ))
-        else:
-            lang_value = has_lang.group(1)
-            # Validate lang value format (should be valid BCP 47 language tag)
-            if not re.match(r'^[a-z]{2}(-[A-Z]{2})?$', lang_value):
-                line_num = content[:html_match.start()].count('\n') + 1
-                issues.append(ReadableIssue(
-                    file_path=str(file_path),
-                    line_num=line_num,
-                    issue_type='language_of_page',
-                    message=f'lang attribute "{lang_value}" should be valid BCP 47 code (e.g., "en", "en-US", "de", "fr")',
-                    sc='3.1.1'
-                ))
     
     return issues
 
-def check_language_of_parts(file_path: Path, lines: List[str]) -> List[ReadableIssue]:
+def check_language_of_parts(file_path: Path, content: str) -> List[ReadableIssue]:
     """
     SC 3.1.2 Language of Parts (Level AA)
     
@@ -166,7 +189,7 @@ def check_language_of_parts(file_path: Path, lines: List[str]) -> List[ReadableI
     
     return issues
 
-def check_unusual_words(file_path: Path, lines: List[str]) -> List[ReadableIssue]:
+def check_unusual_words(file_path: Path, content: str) -> List[ReadableIssue]:
     """
     SC 3.1.3 Unusual Words (Level AAA - Informational)
     
@@ -187,7 +210,7 @@ def check_unusual_words(file_path: Path, lines: List[str]) -> List[ReadableIssue
     
     return issues
 
-def check_abbreviations(file_path: Path, lines: List[str]) -> List[ReadableIssue]:
+def check_abbreviations(file_path: Path, content: str) -> List[ReadableIssue]:
     """
     SC 3.1.4 Abbreviations (Level AAA - Informational)
     
@@ -201,7 +224,6 @@ def check_abbreviations(file_path: Path, lines: List[str]) -> List[ReadableIssue
     - Use <abbr title="Full Text">ABBR</abbr>
     """
     issues = []
-    content = ''.join(lines)
     
     # This is informational only (Level AAA)
     # We can detect abbreviations but won't fail validation
@@ -223,7 +245,7 @@ def check_abbreviations(file_path: Path, lines: List[str]) -> List[ReadableIssue
     
     return issues
 
-def check_reading_level(file_path: Path, lines: List[str]) -> List[ReadableIssue]:
+def check_reading_level(file_path: Path, content: str) -> List[ReadableIssue]:
     """
     SC 3.1.5 Reading Level (Level AAA - Informational)
     
@@ -245,7 +267,7 @@ def check_reading_level(file_path: Path, lines: List[str]) -> List[ReadableIssue
     
     return issues
 
-def check_pronunciation(file_path: Path, lines: List[str]) -> List[ReadableIssue]:
+def check_pronunciation(file_path: Path, content: str) -> List[ReadableIssue]:
     """
     SC 3.1.6 Pronunciation (Level AAA - Informational)
     
@@ -270,21 +292,13 @@ def check_pronunciation(file_path: Path, lines: List[str]) -> List[ReadableIssue
 
 def validate_file(file_path: Path) -> List[ReadableIssue]:
     """Validate a single file for all readable criteria"""
-    lines = read_file_lines(file_path)
-    if not lines:
+    # SC 3.1.1 is the only automated check; the SC 3.1.2-3.1.6 checks are left
+    # to manual review and report nothing yet, so they are not dispatched until they do
+    content = read_file(file_path)
+    if not content:
         return []
     
-    issues = []
-    
-    # Run all checks
-    issues.extend(check_language_of_page(file_path, lines))
-    issues.extend(check_language_of_parts(file_path, lines))
-    issues.extend(check_unusual_words(file_path, lines))
-    issues.extend(check_abbreviations(file_path, lines))
-    issues.extend(check_reading_level(file_path, lines))
-    issues.extend(check_pronunciation(file_path, lines))
-    
-    return issues
+    return check_language_of_page(file_path, content)
 
 def print_violations(issues: List[ReadableIssue], total_files: int) -> None:
     """Print validation results"""
@@ -362,10 +376,11 @@ def main() -> int:
     print(f"Found {len(files)} files to validate")
     print()
     
+    # SC 3.1.1 only applies to _document.tsx, so no other file needs to be read
     all_issues = []
     for file_path in files:
-        issues = validate_file(file_path)
-        all_issues.extend(issues)
+        if file_path.name == '_document.tsx':
+            all_issues.extend(validate_file(file_path))
     
     print_violations(all_issues, len(files))
     
@@ -16,8 +16,13 @@ Exit codes:
 import os
 import re
 import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import accumulate
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import Iterator, List, Tuple, Dict
 
 # ANSI color codes
 RED = '\033[91m'
@@ -30,11 +35,66 @@ RESET = '\033[0m'
 INCLUDE_PATTERNS = ['.tsx', '.jsx', '.ts', '.js', '.css', '.scss']
 EXCLUDE_DIRS = ['node_modules', '.next', 'out', 'build', 'dist', '.git', 'scripts']
 
-# Violation tracking
-violations: Dict[str, List[Tuple[str, int, str]]] = {
-    'three_flashes': [],
-    'reduced_motion': [],
-}
+# Precompiled patterns
+BLINK_RE = re.compile(r'\b(blink|flash|strobe)\b', re.IGNORECASE)
+# One whole-file scan for blink/flash/strobe, animation durations and setInterval delays.
+# Lookahead captures report overlapping matches; [^\S\n] keeps each within one line
+FLASH_TRIGGER_RE = re.compile(
+    r'(?=[abfsBFS\u017f])(?='
+    r'(?P<blink>\b(?i:blink|flash|strobe)\b)'
+    r'|(?P<animation>animation(?:-duration)?:[^\S\n]*(?:[\w-]+[^\S\n]+)?(?P<duration>\d+(?:\.\d+)?)(?P<unit>m?s))'
+    r'|(?P<interval>setInterval[^\S\n]*\([^,\n]*,[^\S\n]*(?P<interval_ms>\d+)[^\S\n]*\))'
+    r')'
+)
+# FLASH_TRIGGER_RE needs one of these in the lowercased content; the last three
+# are folded onto "s"/"i" by IGNORECASE but not by str.lower()
+FLASH_PREFILTER_TOKENS = ('blink', 'flash', 'strobe', 'animation', 'setinterval', '\u017f', '\u0131', '\u0307')
+# Case-insensitive substrings looked for in the context around a rapid animation/interval
+OPACITY_CONTEXT_TOKENS = ('opacity', 'visibility', 'display')
+TOGGLE_CONTEXT_TOKENS = ('toggle', 'opacity', 'visible', 'hidden', 'display', 'show', 'hide')
+# Letters str.lower() leaves alone but a case-insensitive match treats as "s"/"i";
+# translating them before lower() makes substring tests behave like IGNORECASE
+CASE_FOLD_TABLE = str.maketrans({'\u017f': 's', '\u0131': 'i', '\u0130': 'i'})
+REDUCED_MOTION_RE = re.compile(r'prefers-reduced-motion', re.IGNORECASE)
+# [^\S\n] keeps whole-content matches within one line
+KEYFRAMES_RE = re.compile(r'@keyframes[^\S\n]+[\w-]+')
+
+def get_line_starts(lines: List[str]) -> List[int]:
+    """Offset of the first character of each line, plus a sentinel one past the end of the content"""
+    return [0, *accumulate(len(line) + 1 for line in lines)]
+
+
+def line_number(line_starts: List[int], offset: int) -> int:
+    """1-based line number of a character offset in the content"""
+    return bisect_right(line_starts, offset)
+
+
+def line_context(content: str, line_starts: List[int], start: int, end: int) -> str:
+    """Return lines[start:end] joined by newlines, sliced directly from the file content"""
+    start = max(0, start)
+    end = min(len(line_starts) - 1, end)
+    return content[line_starts[start]:line_starts[end] - 1]
+
+
+@dataclass(frozen=True)
+class FileContext:
+    """
+    A scanned file plus the views of its content shared by every check
+    
+    The derived views are computed on first use
+    """
+    path: str
+    content: str
+    
+    @cached_property
+    def lowered(self) -> str:
+        """Lowercased content for case-insensitive substring tests"""
+        return self.content.lower()
+    
+    @cached_property
+    def line_starts(self) -> List[int]:
+        """Offset of the first character of each line (for bisect line lookup)"""
+        return get_line_starts(self.content.split('\n'))
 
 
 def scan_files(root_dir: str) -> List[str]:
@@ -51,7 +111,7 @@ def scan_files(root_dir: str) -> List[str]:
     return sorted(files)
 
 
-def check_three_flashes(file_path: str, content: str) -> List[Tuple[str, int, str]]:
+def check_three_flashes(ctx: FileContext) -> Iterator[Tuple[str, int, str]]:
     """
     Check for flashing/blinking content (WCAG 2.1 SC 2.3.1)
     
@@ -63,40 +123,39 @@ def check_three_flashes(file_path: str, content: str) -> List[Tuple[str, int, st
     
     Threshold: Content MUST NOT flash more than 3 times per second (333ms)
     """
-    violations = []
-    lines = content.split('\n')
+    # Most files mention none of the constructs; reject them before any regex work
+    if not any(token in ctx.lowered for token in FLASH_PREFILTER_TOKENS):
+        return
+    
+    line_starts = ctx.line_starts
+    seen = set()
     
-    for i, line in enumerate(lines, 1):
-        line_stripped = line.strip()
+    for match in FLASH_TRIGGER_RE.finditer(ctx.content):
+        kind = match.lastgroup
+        i = line_number(line_starts, match.start())
         
-        # Check for CSS blink/flash animations
-        blink_pattern = re.search(
-            r'\b(blink|flash|strobe)\b',
-            line_stripped,
-            re.IGNORECASE
-        )
+        # Only the first match of each construct on a line is considered
+        if (kind, i) in seen:
+            continue
+        seen.add((kind, i))
         
-        if blink_pattern:
-            # Check if this is BlinkMacSystemFont (safe)
-            if 'BlinkMacSystemFont' in line_stripped:
-                continue
-            
-            violations.append((
-                file_path,
+        # Check if this is BlinkMacSystemFont (safe) - the whole line is skipped
+        line = line_context(ctx.content, line_starts, i - 1, i)
+        if 'BlinkMacSystemFont' in line and BLINK_RE.search(line):
+            continue
+        
+        if kind == 'blink':
+            # CSS blink/flash animations
+            yield (
+                ctx.path,
                 i,
                 f"Potential flashing/blinking content detected - ensure it doesn't flash more than 3 times per second (SC 2.3.1)"
-            ))
+            )
         
-        # Check for rapid animation durations in CSS
-        # Pattern: animation: <duration> or animation-duration: <duration>
-        animation_duration = re.search(
-            r'animation(?:-duration)?:\s*(?:[\w-]+\s+)?(\d+(?:\.\d+)?)(m?s)',
-            line_stripped
-        )
-        
-        if animation_duration:
-            duration_value = float(animation_duration.group(1))
-            unit = animation_duration.group(2)
+        elif kind == 'animation':
+            # Rapid animation durations in CSS
+            duration_value = float(match.group('duration'))
+            unit = match.group('unit')
             
             # Convert to milliseconds
             duration_ms = duration_value if unit == 'ms' else duration_value * 1000
@@ -104,58 +163,41 @@ def check_three_flashes(file_path: str, content: str) -> List[Tuple[str, int, st
             # Check if animation is rapid (< 333ms per cycle could cause 3+ flashes/sec)
             if duration_ms < 333:
                 # Look for additional context
-                context_start = max(0, i - 5)
-                context_end = min(len(lines), i + 5)
-                context = '\n'.join(lines[context_start:context_end])
+                context = line_context(ctx.content, line_starts, i - 5, i + 5).translate(CASE_FOLD_TABLE).lower()
                 
                 # Check if this is an opacity/visibility animation (potential flash)
-                is_opacity = bool(
-                    re.search(r'opacity|visibility|display', context, re.IGNORECASE)
-                )
+                is_opacity = any(token in context for token in OPACITY_CONTEXT_TOKENS)
                 
                 # Check if animation is infinite (more likely to be problematic)
-                is_infinite = bool(
-                    re.search(r'infinite', context, re.IGNORECASE)
-                )
+                is_infinite = 'infinite' in context
                 
                 # Only flag if it's an opacity change that's infinite
                 if is_opacity and is_infinite:
-                    violations.append((
-                        file_path,
+                    yield (
+                        ctx.path,
                         i,
                         f"Rapid animation ({duration_ms}ms) with opacity/visibility changes could flash more than 3 times/sec (SC 2.3.1)"
-                    ))
-        
-        # Check for setInterval with rapid toggling (JavaScript)
-        interval_pattern = re.search(
-            r'setInterval\s*\([^,]*,\s*(\d+)\s*\)',
-            line_stripped
-        )
+                    )
         
-        if interval_pattern:
-            interval_ms = int(interval_pattern.group(1))
+        else:
+            # setInterval with rapid toggling (JavaScript)
+            interval_ms = int(match.group('interval_ms'))
             
             if interval_ms < 333:
-                context_start = max(0, i - 5)
-                context_end = min(len(lines), i + 5)
-                context = '\n'.join(lines[context_start:context_end])
+                context = line_context(ctx.content, line_starts, i - 5, i + 5).translate(CASE_FOLD_TABLE).lower()
                 
                 # Check if this is toggling visibility/opacity
-                is_toggle = bool(
-                    re.search(r'toggle|opacity|visible|hidden|display|show|hide', context, re.IGNORECASE)
-                )
+                is_toggle = any(token in context for token in TOGGLE_CONTEXT_TOKENS)
                 
                 if is_toggle:
-                    violations.append((
-                        file_path,
+                    yield (
+                        ctx.path,
                         i,
                         f"Rapid setInterval ({interval_ms}ms) with visibility toggling could flash more than 3 times/sec (SC 2.3.1)"
-                    ))
-    
-    return violations
+                    )
 
 
-def check_reduced_motion(file_path: str, content: str) -> List[Tuple[str, int, str]]:
+def check_reduced_motion(ctx: FileContext) -> Iterator[Tuple[str, int, str]]:
     """
     Check for prefers-reduced-motion support (WCAG 2.1 SC 2.3.3 - Level AAA, best practice)
     
@@ -165,37 +207,42 @@ def check_reduced_motion(file_path: str, content: str) -> List[Tuple[str, int, s
     
     Note: This is Level AAA (not required for AA), but it's a best practice
     """
-    violations = []
-    lines = content.split('\n')
-    
     # Skip non-CSS/animation files
-    if not (file_path.endswith('.css') or file_path.endswith('.scss')):
-        return violations
+    if not (ctx.path.endswith('.css') or ctx.path.endswith('.scss')):
+        return
     
     # Check if file has animations
-    has_animations = bool(re.search(r'@keyframes|animation:', content))
-    
-    if not has_animations:
-        return violations
+    if '@keyframes' not in ctx.content and 'animation:' not in ctx.content:
+        return
     
     # Check if prefers-reduced-motion is implemented
-    has_reduced_motion = bool(
-        re.search(r'prefers-reduced-motion', content, re.IGNORECASE)
-    )
+    has_reduced_motion = bool(REDUCED_MOTION_RE.search(ctx.content))
     
     if not has_reduced_motion:
-        # Find animations and flag them
-        for i, line in enumerate(lines, 1):
-            if re.search(r'@keyframes\s+[\w-]+', line):
-                violations.append((
-                    file_path,
-                    i,
-                    f"Animation should respect prefers-reduced-motion media query (Best Practice - Level AAA)"
-                ))
-                # Only report once per file
-                break
-    
-    return violations
+        # Find animations and flag them (only report once per file)
+        keyframes = KEYFRAMES_RE.search(ctx.content)
+        if keyframes:
+            yield (
+                ctx.path,
+                line_number(ctx.line_starts, keyframes.start()),
+                f"Animation should respect prefers-reduced-motion media query (Best Practice - Level AAA)"
+            )
+
+
+def check_file(file_path: str) -> Tuple[Dict[str, List[Tuple[str, int, str]]], str]:
+    """Run all checks on a single file, returning its violations and any read/processing error"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        # Run all checks on a shared context
+        ctx = FileContext(file_path, content)
+        return {
+            'three_flashes': list(check_three_flashes(ctx)),
+            'reduced_motion': list(check_reduced_motion(ctx)),
+        }, ''
+    except Exception as e:
+        return {}, str(e)
 
 
 def print_violations(violations: Dict[str, List[Tuple[str, int, str]]]) -> None:
@@ -252,18 +299,21 @@ def main():
     files = scan_files(str(project_root))
     print(f"Files to check: {len(files)}\n")
     
-    # Run checks on each file
-    for file_path in files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Run all checks
-            violations['three_flashes'].extend(check_three_flashes(file_path, content))
-            violations['reduced_motion'].extend(check_reduced_motion(file_path, content))
+    # Violation tracking
+    violations: Dict[str, List[Tuple[str, int, str]]] = {
+        'three_flashes': [],
+        'reduced_motion': [],
+    }
+    
+    # Run checks on each file; files are independent, so spread them across all CPU cores
+    with ProcessPoolExecutor() as executor:
+        for file_path, (file_violations, error) in zip(files, executor.map(check_file, files, chunksize=16)):
+            if error:
+                print(f"{YELLOW}Warning: Could not process {file_path}: {error}{RESET}")
+                continue
             
-        except Exception as e:
-            print(f"{YELLOW}Warning: Could not process {file_path}: {e}{RESET}")
+            for check_type, items in file_violations.items():
+                violations[check_type].extend(items)
     
     # Print results
     print(f"{BLUE}{'='*80}{RESET}")